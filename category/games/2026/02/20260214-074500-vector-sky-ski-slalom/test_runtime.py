@@ -23,25 +23,19 @@ def simulate_ai_inputs(game_state, elapsed_time):
     if game_state.game_over:
         return inputs
 
-    # Find nearest obstacle
-    nearest_obstacle = None
-    nearest_y = float('inf')
+    look_ahead_y = game_state.player.y - 200  # Only look ahead
 
-    for obstacle in game_state.obstacles:
-        if obstacle.y > game_state.player.y - 200:  # Only look ahead
-            if obstacle.y < nearest_y:
-                nearest_y = obstacle.y
-                nearest_obstacle = obstacle
+    # Find nearest obstacle
+    nearest_obstacle = min(
+        (o for o in game_state.obstacles if o.y > look_ahead_y),
+        key=lambda o: o.y, default=None
+    )
 
     # Find nearest gate
-    nearest_gate = None
-    nearest_gate_y = float('inf')
-
-    for gate in game_state.gates:
-        if gate.y > game_state.player.y - 200:
-            if gate.y < nearest_gate_y:
-                nearest_gate_y = gate.y
-                nearest_gate = gate
+    nearest_gate = min(
+        (g for g in game_state.gates if g.y > look_ahead_y),
+        key=lambda g: g.y, default=None
+    )
 
     # Simple avoidance logic
     player_center = game_state.player.x
@@ -147,8 +141,11 @@ def run_runtime_analysis(max_duration_seconds=120):
         print("[*] Running gameplay simulation...")
         running = True
 
-        while running and (time.time() - start_time) < max_duration_seconds:
-            current_time = time.time() - start_time
+        while running:
+            now = time.time()
+            current_time = now - start_time
+            if current_time >= max_duration_seconds:
+                break
             dt = clock.tick(60) / 1000.0
 
             # Generate simulated AI inputs
@@ -170,11 +167,11 @@ def run_runtime_analysis(max_duration_seconds=120):
             frame_count += 1
             fps_frame_count += 1
 
-            if time.time() - last_fps_update >= 1.0:
-                fps = fps_frame_count / (time.time() - last_fps_update)
+            if now - last_fps_update >= 1.0:
+                fps = fps_frame_count / (now - last_fps_update)
                 fps_samples.append(fps)
                 fps_frame_count = 0
-                last_fps_update = time.time()
+                last_fps_update = now
 
                 analysis['events'].append({
                     'time': round(current_time, 2),
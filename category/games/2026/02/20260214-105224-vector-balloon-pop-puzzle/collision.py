@@ -0,0 +1,52 @@
+"""Collision and chain-search hot paths for Vector Balloon Pop Puzzle.
+
+This module has no pygame dependency and is fully annotated so it can be
+compiled ahead of time with mypyc (``mypyc collision.py``). When no compiled
+extension is present, Python imports this source unchanged.
+"""
+
+from typing import Optional
+
+from config import GRID_COLS, GRID_ROWS
+
+# (dcol, drow) offsets of the four orthogonal neighbours
+_DIRS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+def first_hit(buckets: list, first_col: int, last_col: int,
+              x: float, y: float, radius: float) -> Optional[object]:
+    """Return the first balloon in columns first_col..last_col overlapping a circle."""
+    for col in range(first_col, last_col + 1):
+        for balloon in buckets[col]:
+            dx: float = x - balloon.x
+            dy: float = y - balloon.y
+            r: float = balloon.radius + radius
+
+            if dx * dx + dy * dy < r * r:
+                return balloon
+
+    return None
+
+
+def flood(grid: list[list[int]], col: int, row: int) -> list[tuple[int, int]]:
+    """Flood-fill same-colored cells from (col, row); returns (col, row) pairs."""
+    color: int = grid[row][col]
+    visited = bytearray(GRID_COLS * GRID_ROWS)
+    visited[row * GRID_COLS + col] = 1
+    stack: list[tuple[int, int]] = [(col, row)]
+    cells: list[tuple[int, int]] = []
+
+    while stack:
+        c, r = stack.pop()
+        cells.append((c, r))
+
+        for dc, dr in _DIRS:
+            nc = c + dc
+            nr = r + dr
+            if 0 <= nc < GRID_COLS and 0 <= nr < GRID_ROWS:
+                i = nr * GRID_COLS + nc
+                if not visited[i] and grid[nr][nc] == color:
+                    visited[i] = 1
+                    stack.append((nc, nr))
+
+    return cells
@@ -38,3 +38,7 @@ LAUNCHER_SPEED = 5
 # Physics
 GRAVITY = 0.3
 BALLOON_FLOAT_SPEED = 2
+
+# Performance
+PRECISE_FRAME_PACING = False  # tick_busy_loop spins the CPU for exact frame timing
+VECTORIZED_COLLISION_MIN_PAIRS = 200
@@ -2,31 +2,35 @@
 
 import math
 import random
+import numpy as np
 import pygame
 from config import *
+from collision import first_hit, flood
 
 
 class Balloon:
     """Represents a balloon on the grid."""
 
+    _sprites = {}
+
     def __init__(self, col, row, color_idx):
         self.col = col
         self.row = row
         self.color_idx = color_idx
         self.color = BALLOON_COLORS[color_idx]
         self.radius = CELL_SIZE // 2 - 4
+        self.x = GRID_START_X + col * CELL_SIZE + CELL_SIZE // 2
         self.y = GRID_START_Y + row * CELL_SIZE + CELL_SIZE // 2
         self.target_y = self.y
         self.popping = False
+        self.dead = False
         self.pop_scale = 1.0
         self.pop_speed = 0.1
 
     def update(self):
-        """Update balloon animation."""
-        if self.popping:
-            self.pop_scale -= self.pop_speed
-            return self.pop_scale <= 0
-        return False
+        """Advance the pop animation; returns True once fully popped."""
+        self.pop_scale -= self.pop_speed
+        return self.pop_scale <= 0
 
     def move_towards_target(self):
         """Move balloon towards target position (floating up effect)."""
@@ -36,17 +40,25 @@ class Balloon:
                 self.y = self.target_y
 
     def draw(self, surface):
-        """Draw the balloon."""
-        if self.popping:
-            radius = int(self.radius * self.pop_scale)
-            if radius <= 0:
-                return
-        else:
-            radius = self.radius
-
-        x = GRID_START_X + self.col * CELL_SIZE + CELL_SIZE // 2
-        pygame.draw.circle(surface, self.color, (int(x), int(self.y)), radius)
-        pygame.draw.circle(surface, COLOR_WHITE, (int(x - radius * 0.3), int(self.y - radius * 0.3)), int(radius * 0.2))
+        """Draw the balloon and return the touched rect (None if fully popped)."""
+        radius = int(self.radius * self.pop_scale)
+        if radius <= 0:
+            return None
+
+        sprite = self.get_sprite(self.color_idx, radius)
+        return surface.blit(sprite, (self.x - radius, int(self.y) - radius))
+
+    @classmethod
+    def get_sprite(cls, color_idx, radius):
+        """Get the cached balloon sprite for a color and radius."""
+        key = (color_idx, radius)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, BALLOON_COLORS[color_idx], (radius, radius), radius)
+            pygame.draw.circle(sprite, COLOR_WHITE, (int(radius - radius * 0.3), int(radius - radius * 0.3)), int(radius * 0.2))
+            cls._sprites[key] = sprite
+        return sprite
 
 
 class Dart:
@@ -56,14 +68,16 @@ class Dart:
         self.x = x
         self.y = y
         self.angle = angle
+        self._cos = math.cos(angle)
+        self._sin = math.sin(angle)
         self.speed = DART_SPEED
         self.active = True
         self.radius = 5
 
     def update(self):
         """Update dart position."""
-        self.x += math.cos(self.angle) * self.speed
-        self.y -= math.sin(self.angle) * self.speed
+        self.x += self._cos * self.speed
+        self.y -= self._sin * self.speed
 
         # Check bounds
         if (self.x < 0 or self.x > SCREEN_WIDTH or
@@ -71,11 +85,11 @@ class Dart:
             self.active = False
 
     def draw(self, surface):
-        """Draw the dart."""
-        end_x = self.x - math.cos(self.angle) * 15
-        end_y = self.y + math.sin(self.angle) * 15
-        pygame.draw.line(surface, COLOR_BLACK, (self.x, self.y), (end_x, end_y), 3)
-        pygame.draw.circle(surface, COLOR_GRAY, (int(self.x), int(self.y)), self.radius)
+        """Draw the dart and return the touched rect."""
+        end_x = self.x - self._cos * 15
+        end_y = self.y + self._sin * 15
+        rect = pygame.draw.line(surface, COLOR_BLACK, (self.x, self.y), (end_x, end_y), 3)
+        return rect.union(pygame.draw.circle(surface, COLOR_GRAY, (int(self.x), int(self.y)), self.radius))
 
 
 class Launcher:
@@ -87,6 +101,8 @@ class Launcher:
         self.width = LAUNCHER_WIDTH
         self.height = LAUNCHER_HEIGHT
         self.angle = math.pi / 2  # Pointing straight up
+        self._cos = math.cos(self.angle)
+        self._sin = math.sin(self.angle)
 
     def move_left(self):
         """Move launcher left."""
@@ -103,23 +119,25 @@ class Launcher:
     def adjust_angle(self, delta):
         """Adjust aim angle."""
         self.angle = max(math.pi / 4, min(3 * math.pi / 4, self.angle + delta))
+        self._cos = math.cos(self.angle)
+        self._sin = math.sin(self.angle)
 
     def get_tip_position(self):
         """Get the tip position for dart spawning."""
-        tip_x = self.x + math.cos(self.angle) * self.height // 2
-        tip_y = self.y - math.sin(self.angle) * self.height // 2
+        tip_x = self.x + self._cos * self.height // 2
+        tip_y = self.y - self._sin * self.height // 2
         return tip_x, tip_y
 
     def draw(self, surface):
-        """Draw the launcher."""
+        """Draw the launcher and return the touched rect."""
         tip_x, tip_y = self.get_tip_position()
 
         # Draw launcher body
-        base_x = self.x - math.cos(self.angle) * self.height // 2
-        base_y = self.y + math.sin(self.angle) * self.height // 2
+        base_x = self.x - self._cos * self.height // 2
+        base_y = self.y + self._sin * self.height // 2
 
-        pygame.draw.line(surface, COLOR_GRAY, (base_x, base_y), (tip_x, tip_y), 8)
-        pygame.draw.circle(surface, COLOR_BLACK, (int(self.x), int(self.y)), 15)
+        rect = pygame.draw.line(surface, COLOR_GRAY, (base_x, base_y), (tip_x, tip_y), 8)
+        return rect.union(pygame.draw.circle(surface, COLOR_BLACK, (int(self.x), int(self.y)), 15))
 
 
 class Game:
@@ -132,6 +150,8 @@ class Game:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._score_cache = (None, None)
+        self._darts_cache = (None, None)
 
         self.reset_game()
 
@@ -145,6 +165,14 @@ class Game:
         self.game_over = False
         self.won = False
         self.pop_queue = []
+        self._drawn_rects = None  # Forces a full display flip on the next draw
+        self.balloons_by_col = [[] for _ in range(GRID_COLS)]
+        self.active_count = 0
+        # Generation leaves gaps, so every column is compacted on the first pop
+        self._dirty_cols = set(range(GRID_COLS))
+        self.grid = [[None] * GRID_COLS for _ in range(GRID_ROWS)]
+        self.color_grid = np.full((GRID_ROWS, GRID_COLS), -1, dtype=np.int8)
+        self._balloon_arrays_dirty = True
         self.generate_balloons()
 
     def generate_balloons(self):
@@ -153,46 +181,24 @@ class Game:
             for col in range(GRID_COLS):
                 if random.random() < 0.85:  # 85% fill rate
                     color_idx = random.randint(0, len(BALLOON_COLORS) - 1)
-                    self.balloons.append(Balloon(col, row, color_idx))
+                    balloon = Balloon(col, row, color_idx)
+                    self.balloons.append(balloon)
+                    self.balloons_by_col[col].append(balloon)
+                    self.grid[row][col] = balloon
+                    self.color_grid[row, col] = color_idx
+                    self.active_count += 1
 
     def get_balloon_at(self, col, row):
         """Get balloon at grid position."""
-        for balloon in self.balloons:
-            if not balloon.popping and balloon.col == col and balloon.row == row:
-                return balloon
+        if 0 <= col < GRID_COLS and 0 <= row < GRID_ROWS:
+            return self.grid[row][col]
         return None
 
-    def get_neighbors(self, balloon):
-        """Get adjacent balloons of the same color."""
-        neighbors = []
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-
-        for dx, dy in directions:
-            neighbor = self.get_balloon_at(balloon.col + dx, balloon.row + dy)
-            if neighbor and neighbor.color_idx == balloon.color_idx:
-                neighbors.append(neighbor)
-
-        return neighbors
-
     def find_chain(self, start_balloon):
         """Find all connected balloons of the same color."""
-        visited = set()
-        queue = [start_balloon]
-        chain = []
-
-        while queue:
-            balloon = queue.pop(0)
-            if balloon in visited:
-                continue
-
-            visited.add(balloon)
-            chain.append(balloon)
-
-            for neighbor in self.get_neighbors(balloon):
-                if neighbor not in visited:
-                    queue.append(neighbor)
-
-        return chain
+        # Python ints index far faster than NumPy scalars in the flood loop
+        cells = flood(self.color_grid.tolist(), start_balloon.col, start_balloon.row)
+        return [self.grid[row][col] for col, row in cells]
 
     def pop_chain(self, chain):
         """Pop a chain of balloons and update score."""
@@ -203,45 +209,82 @@ class Game:
             if not balloon.popping:
                 balloon.popping = True
                 self.pop_queue.append(balloon)
+                self.balloons_by_col[balloon.col].remove(balloon)
+                self.grid[balloon.row][balloon.col] = None
+                self.color_grid[balloon.row, balloon.col] = -1
+                self.active_count -= 1
+                self._dirty_cols.add(balloon.col)
+                self._balloon_arrays_dirty = True
 
     def check_dart_collision(self, dart):
-        """Check if dart hits any balloon."""
-        for balloon in self.balloons:
-            if balloon.popping:
-                continue
-
-            bx = GRID_START_X + balloon.col * CELL_SIZE + CELL_SIZE // 2
-            by = balloon.y
+        """Check if dart hits any balloon in the columns around the dart."""
+        col_center = int((dart.x - GRID_START_X) // CELL_SIZE)
+        first_col = max(0, col_center - 1)
+        last_col = min(GRID_COLS - 1, col_center + 1)
 
-            distance = math.sqrt((dart.x - bx) ** 2 + (dart.y - by) ** 2)
+        return first_hit(self.balloons_by_col, first_col, last_col,
+                         dart.x, dart.y, dart.radius)
 
-            if distance < balloon.radius + dart.radius:
-                return balloon
+    def _sync_balloon_arrays(self):
+        """Rebuild the SoA arrays of collidable balloons if membership changed."""
+        if not self._balloon_arrays_dirty:
+            return
 
-        return None
+        self._collidable = [b for col in self.balloons_by_col for b in col]
+        self._bx = np.array([b.x for b in self._collidable], dtype=np.float64)
+        self._bradius = np.array([b.radius for b in self._collidable], dtype=np.float64)
+        self._balloon_arrays_dirty = False
+
+    def check_all_dart_collisions(self):
+        """Return the balloon hit by each dart (or None), in dart order."""
+        if len(self.darts) * self.active_count <= VECTORIZED_COLLISION_MIN_PAIRS:
+            return [self.check_dart_collision(dart) for dart in self.darts]
+
+        self._sync_balloon_arrays()
+        by = np.fromiter((b.y for b in self._collidable), dtype=np.float64,
+                         count=len(self._collidable))
+        dart_xs = np.array([d.x for d in self.darts], dtype=np.float64)
+        dart_ys = np.array([d.y for d in self.darts], dtype=np.float64)
+        dart_radius = np.array([d.radius for d in self.darts], dtype=np.float64)
+
+        dx = self._bx[None, :] - dart_xs[:, None]
+        dy = by[None, :] - dart_ys[:, None]
+        r = self._bradius[None, :] + dart_radius[:, None]
+        mask = dx * dx + dy * dy < r * r
+
+        hit_any = mask.any(axis=1)
+        first_hit = mask.argmax(axis=1)
+        return [self._collidable[first_hit[i]] if hit_any[i] else None
+                for i in range(len(self.darts))]
 
     def update_balloon_positions(self):
-        """Update balloon positions after pops (floating up)."""
-        for col in range(GRID_COLS):
-            balloons_in_col = sorted(
-                [b for b in self.balloons if not b.popping and b.col == col],
-                key=lambda b: b.row
-            )
-
-            for new_row, balloon in enumerate(balloons_in_col):
-                balloon.row = new_row
-                balloon.target_y = GRID_START_Y + new_row * CELL_SIZE + CELL_SIZE // 2
-
-    def handle_input(self):
-        """Handle keyboard input."""
-        keys = pygame.key.get_pressed()
-
+        """Update balloon positions in columns that had pops (floating up)."""
+        for col in self._dirty_cols:
+            write = 0
+            for row in range(GRID_ROWS):
+                balloon = self.grid[row][col]
+                if balloon is None:
+                    continue
+
+                if row != write:
+                    self.grid[row][col] = None
+                    self.color_grid[row, col] = -1
+                    self.grid[write][col] = balloon
+                    self.color_grid[write, col] = balloon.color_idx
+                    balloon.row = write
+                    balloon.target_y = GRID_START_Y + write * CELL_SIZE + CELL_SIZE // 2
+                write += 1
+
+        self._dirty_cols.clear()
+
+    def handle_input(self, events, keys):
+        """Handle keyboard input for one frame's events and key state."""
         if keys[pygame.K_LEFT]:
             self.launcher.move_left()
         if keys[pygame.K_RIGHT]:
             self.launcher.move_right()
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
 
@@ -264,43 +307,48 @@ class Game:
             return
 
         # Update darts
-        for dart in self.darts[:]:
+        for dart in self.darts:
             dart.update()
+        self.darts = [d for d in self.darts if d.active]
 
-            if not dart.active:
-                self.darts.remove(dart)
-                continue
-
-            hit_balloon = self.check_dart_collision(dart)
+        hits = self.check_all_dart_collisions()
+        for dart, hit_balloon in zip(self.darts, hits):
+            if hit_balloon and hit_balloon.popping:
+                # Popped by an earlier dart this frame; look again
+                hit_balloon = self.check_dart_collision(dart)
             if hit_balloon:
                 chain = self.find_chain(hit_balloon)
                 self.pop_chain(chain)
-                self.darts.remove(dart)
+                dart.active = False
+        self.darts = [d for d in self.darts if d.active]
 
         # Update popping balloons
-        for balloon in self.pop_queue[:]:
+        any_dead = False
+        for balloon in self.pop_queue:
             if balloon.update():
-                self.balloons.remove(balloon)
-                self.pop_queue.remove(balloon)
+                balloon.dead = True
+                any_dead = True
+        if any_dead:
+            self.balloons = [b for b in self.balloons if not b.dead]
+            self.pop_queue = [b for b in self.pop_queue if not b.dead]
 
         # Update balloon positions
         for balloon in self.balloons:
             balloon.move_towards_target()
 
         # Check if update needed after pops
-        if self.pop_queue:
+        if self.pop_queue and self._dirty_cols:
             self.update_balloon_positions()
 
         # Check win/lose conditions
-        active_balloons = [b for b in self.balloons if not b.popping]
-        if not active_balloons:
+        if self.active_count == 0:
             self.game_over = True
             self.won = True
         elif self.darts_remaining == 0 and not self.darts:
             self.game_over = True
 
     def draw(self):
-        """Draw everything."""
+        """Draw everything and push only the changed regions to the display."""
         self.screen.fill(COLOR_BLACK)
 
         # Draw grid outline
@@ -310,29 +358,38 @@ class Game:
                         (GRID_START_X - 2, GRID_START_Y - 2,
                          grid_width + 4, grid_height + 4), 2)
 
+        # Rects of everything that can change, keyed by what was drawn
+        drawn = {}
+
         # Draw balloons
         for balloon in self.balloons:
-            balloon.draw(self.screen)
+            rect = balloon.draw(self.screen)
+            if rect:
+                drawn[balloon] = rect
 
         # Draw darts
         for dart in self.darts:
-            dart.draw(self.screen)
+            drawn[dart] = dart.draw(self.screen)
 
         # Draw launcher
-        self.launcher.draw(self.screen)
+        launcher_rect = self.launcher.draw(self.screen)
 
         # Draw trajectory guide
         tip_x, tip_y = self.launcher.get_tip_position()
         guide_length = 50
-        guide_x = tip_x + math.cos(self.launcher.angle) * guide_length
-        guide_y = tip_y - math.sin(self.launcher.angle) * guide_length
-        pygame.draw.line(self.screen, (100, 100, 100), (tip_x, tip_y), (guide_x, guide_y), 1)
+        guide_x = tip_x + self.launcher._cos * guide_length
+        guide_y = tip_y - self.launcher._sin * guide_length
+        guide_rect = pygame.draw.line(self.screen, (100, 100, 100), (tip_x, tip_y), (guide_x, guide_y), 1)
+        drawn[("launcher", self.launcher.x, self.launcher.angle)] = launcher_rect.union(guide_rect)
 
         # Draw UI
-        score_text = self.font.render(f"Score: {self.score}", True, COLOR_WHITE)
-        darts_text = self.font.render(f"Darts: {self.darts_remaining}", True, COLOR_WHITE)
-        self.screen.blit(score_text, (20, 10))
-        self.screen.blit(darts_text, (SCREEN_WIDTH - 150, 10))
+        if self.score != self._score_cache[0]:
+            self._score_cache = (self.score, self.font.render(f"Score: {self.score}", True, COLOR_WHITE))
+        if self.darts_remaining != self._darts_cache[0]:
+            self._darts_cache = (self.darts_remaining,
+                                 self.font.render(f"Darts: {self.darts_remaining}", True, COLOR_WHITE))
+        drawn[("score", self.score)] = self.screen.blit(self._score_cache[1], (20, 10))
+        drawn[("darts", self.darts_remaining)] = self.screen.blit(self._darts_cache[1], (SCREEN_WIDTH - 150, 10))
 
         # Draw game over message
         if self.game_over:
@@ -347,16 +404,29 @@ class Game:
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             pygame.draw.rect(self.screen, COLOR_BLACK, rect.inflate(20, 10))
             self.screen.blit(text, rect)
+            drawn[("message", msg)] = rect.inflate(20, 10)
 
-        pygame.display.flip()
+        if self._drawn_rects is None:
+            pygame.display.flip()
+        else:
+            # Old and new rects of anything that moved, changed or disappeared
+            dirty = [rect for key, rect in drawn.items() if self._drawn_rects.get(key) != rect]
+            dirty.extend(rect for key, rect in self._drawn_rects.items() if drawn.get(key) != rect)
+            if dirty:
+                pygame.display.update(dirty)
+        self._drawn_rects = drawn
 
     def run(self):
         """Main game loop."""
+        # Game.update is frame-based, so the tick's elapsed time is not needed
+        tick = self.clock.tick_busy_loop if PRECISE_FRAME_PACING else self.clock.tick
         running = True
         while running:
-            running = self.handle_input()
+            pygame.event.pump()
+            keys = pygame.key.get_pressed()
+            running = self.handle_input(pygame.event.get(pump=False), keys)
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            tick(FPS)
 
         pygame.quit()
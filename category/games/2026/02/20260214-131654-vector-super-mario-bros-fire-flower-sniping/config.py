@@ -28,6 +28,7 @@ STAGE_CLEAR_BONUS = 500
 GRAVITY = 0.5
 BOUNCE_VELOCITY_MULTIPLIER = 0.8
 FIREBALL_SPEED = 10
+FIREBALL_RADIUS = 8
 FIREBALL_MAX_BOUNCES = 5
 FIREBALL_LIFETIME = 300
 
@@ -41,6 +42,12 @@ PLAYER_ARM_SPEED = 2
 ENEMY_WIDTH = 30
 ENEMY_HEIGHT = 30
 PIRANHA_HEIGHT = 40
+ENEMY_SPEED = 0.5
+ENEMY_TURN_X = 200  # Walking enemies turn back at this x
 
 # Platform
 PLATFORM_HEIGHT = 15
+PLATFORM_GRID_CELL = 64  # Broadphase grid cell size in pixels
+
+# UI
+TEXT_CACHE_SIZE = 64  # Rendered text surfaces kept between frames
@@ -2,119 +2,153 @@
 
 import math
 import random
+import time
+import numpy as np
 import pygame
 from config import *
 
 
-class Fireball:
-    """Represents a fireball projectile with bouncing physics."""
-
-    def __init__(self, x, y, angle):
-        self.x = x
-        self.y = y
-        self.vx = math.cos(angle) * FIREBALL_SPEED
-        self.vy = -math.sin(angle) * FIREBALL_SPEED
-        self.radius = 8
-        self.active = True
-        self.bounces = 0
-        self.lifetime = FIREBALL_LIFETIME
-
-    def update(self, platforms):
-        """Update fireball position and handle bounces."""
-        if not self.active:
-            return
+# Platform sides in tie-break order (top, bottom, left, right): the direction
+# a fireball is pushed out along, and which platform box edge it lands on
+PLATFORM_SIDE_SIGN = np.array([-1, 1, -1, 1], dtype=np.float64)
+PLATFORM_SIDE_EDGE = np.array([1, 3, 0, 2])
+
+
+def platforms_near(platform_grid, xs, ys):
+    """Indices of platforms sharing a grid cell with any fireball at (xs, ys)."""
+    r = FIREBALL_RADIUS
+    near = set()
+    for fx, fy in zip(xs.tolist(), ys.tolist()):
+        for cx in range(int(fx - r) // PLATFORM_GRID_CELL, int(fx + r) // PLATFORM_GRID_CELL + 1):
+            for cy in range(int(fy - r) // PLATFORM_GRID_CELL, int(fy + r) // PLATFORM_GRID_CELL + 1):
+                near.update(platform_grid.get((cx, cy), ()))
+    return near
+
+
+def step_fireballs(x, y, vx, vy, life, bounces, active, platform_boxes, platform_grid):
+    """Advance every active fireball by one physics tick, in place.
+
+    Touches only the fireball arrays and the stage's platform boxes and grid,
+    never Game or pygame state.
+    """
+    if not active.any():
+        return
+
+    r = FIREBALL_RADIUS
+    mult = BOUNCE_VELOCITY_MULTIPLIER
+
+    # Apply gravity and update position
+    vy[active] += GRAVITY
+    x[active] += vx[active]
+    y[active] += vy[active]
+
+    # Decrease lifetime; expired fireballs skip bounce handling
+    life[active] -= 1
+    active &= life > 0
+
+    # Floor bounce
+    floor_y = SCREEN_HEIGHT - 20 - r
+    hit = active & (y >= floor_y)
+    y[hit] = floor_y
+    vy[hit] = -vy[hit] * mult
+    bounces[hit] += 1
+
+    # Ceiling bounce
+    hit = active & (y <= r)
+    y[hit] = r
+    vy[hit] = -vy[hit] * mult
+    bounces[hit] += 1
+
+    # Wall bounce
+    right = active & (x >= SCREEN_WIDTH - r)
+    left = active & ~right & (x <= r)
+    x[right] = SCREEN_WIDTH - r
+    x[left] = r
+    hit = right | left
+    vx[hit] = -vx[hit] * mult
+    bounces[hit] += 1
+
+    # Platform bounces; the grid narrows the platforms to test, and they
+    # resolve in stage order since a bounce moves the fireball
+    pending = sorted(platforms_near(platform_grid, x[active], y[active]))
+    k = 0
+    while k < len(pending):
+        j = pending[k]
+        k += 1
+        left_x, top_y, right_x, bottom_y = platform_boxes[j]
+        hit = (active & (x + r > left_x) & (x - r < right_x) &
+               (y + r > top_y) & (y - r < bottom_y))
+        if not hit.any():
+            continue
+
+        # Side with the smallest overlap was hit; argmin keeps the first on ties
+        overlaps = np.stack((
+            (y + r) - top_y,
+            bottom_y - (y - r),
+            (x + r) - left_x,
+            right_x - (x - r),
+        ))
+        side = np.argmin(overlaps, axis=0)
+        sign = PLATFORM_SIDE_SIGN[side]
+        edge = platform_boxes[j][PLATFORM_SIDE_EDGE[side]] + sign * r
+
+        vertical = hit & (side < 2)
+        horizontal = hit & (side >= 2)
+        y[vertical] = edge[vertical]
+        vy[vertical] = sign[vertical] * np.abs(vy[vertical]) * mult
+        x[horizontal] = edge[horizontal]
+        vx[horizontal] = sign[horizontal] * np.abs(vx[horizontal]) * mult
+        bounces[hit] += 1
+
+        # A bounced fireball may now touch a later platform it did not before
+        moved_near = {i for i in platforms_near(platform_grid, x[hit], y[hit]) if i > j}
+        moved_near.difference_update(pending[k:])
+        if moved_near:
+            pending[k:] = sorted(moved_near.union(pending[k:]))
+
+    # Deactivate worn-out fireballs
+    active &= bounces < FIREBALL_MAX_BOUNCES
 
-        # Apply gravity
-        self.vy += GRAVITY
 
-        # Update position
-        self.x += self.vx
-        self.y += self.vy
+class Fireball:
+    """View of one active slot in the Game's fireball arrays, used for drawing."""
 
-        # Decrease lifetime
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.active = False
-            return
+    radius = FIREBALL_RADIUS
+    _glow_cache = {}
 
-        # Floor bounce
-        if self.y >= SCREEN_HEIGHT - 20 - self.radius:
-            self.y = SCREEN_HEIGHT - 20 - self.radius
-            self.vy = -self.vy * BOUNCE_VELOCITY_MULTIPLIER
-            self.bounces += 1
-
-        # Ceiling bounce
-        if self.y <= self.radius:
-            self.y = self.radius
-            self.vy = -self.vy * BOUNCE_VELOCITY_MULTIPLIER
-            self.bounces += 1
-
-        # Wall bounce
-        if self.x >= SCREEN_WIDTH - self.radius:
-            self.x = SCREEN_WIDTH - self.radius
-            self.vx = -self.vx * BOUNCE_VELOCITY_MULTIPLIER
-            self.bounces += 1
-        elif self.x <= self.radius:
-            self.x = self.radius
-            self.vx = -self.vx * BOUNCE_VELOCITY_MULTIPLIER
-            self.bounces += 1
-
-        # Platform bounces
-        for platform in platforms:
-            if self.check_platform_collision(platform):
-                self.handle_platform_bounce(platform)
-                self.bounces += 1
-
-        # Check if should deactivate
-        if self.bounces >= FIREBALL_MAX_BOUNCES:
-            self.active = False
-
-    def check_platform_collision(self, platform):
-        """Check collision with a platform."""
-        if self.x + self.radius > platform.x and self.x - self.radius < platform.x + platform.width:
-            if self.y + self.radius > platform.y and self.y - self.radius < platform.y + platform.height:
-                return True
-        return False
-
-    def handle_platform_bounce(self, platform):
-        """Handle bounce off a platform."""
-        # Determine which side was hit
-        overlap_left = (self.x + self.radius) - platform.x
-        overlap_right = (platform.x + platform.width) - (self.x - self.radius)
-        overlap_top = (self.y + self.radius) - platform.y
-        overlap_bottom = (platform.y + platform.height) - (self.y - self.radius)
-
-        min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
-
-        if min_overlap == overlap_top:
-            self.y = platform.y - self.radius
-            self.vy = -abs(self.vy) * BOUNCE_VELOCITY_MULTIPLIER
-        elif min_overlap == overlap_bottom:
-            self.y = platform.y + platform.height + self.radius
-            self.vy = abs(self.vy) * BOUNCE_VELOCITY_MULTIPLIER
-        elif min_overlap == overlap_left:
-            self.x = platform.x - self.radius
-            self.vx = -abs(self.vx) * BOUNCE_VELOCITY_MULTIPLIER
-        else:
-            self.x = platform.x + platform.width + self.radius
-            self.vx = abs(self.vx) * BOUNCE_VELOCITY_MULTIPLIER
+    def __init__(self, x, y, vx, vy, bounces):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.bounces = bounces
 
     def draw(self, surface):
         """Draw the fireball."""
-        if not self.active:
-            return
+        x, y = int(self.x), int(self.y)
 
         # Draw main fireball
-        pygame.draw.circle(surface, COLOR_ORANGE, (int(self.x), int(self.y)), self.radius)
+        pygame.draw.circle(surface, COLOR_ORANGE, (x, y), self.radius)
         pygame.draw.circle(surface, COLOR_YELLOW, (int(self.x - 2), int(self.y - 2)), self.radius // 2)
 
         # Draw glow effect
-        for i in range(3):
-            alpha = 100 - i * 30
-            glow_radius = self.radius + (i + 1) * 2
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*COLOR_ORANGE, alpha), (glow_radius, glow_radius), glow_radius)
-            surface.blit(glow_surface, (int(self.x) - glow_radius, int(self.y) - glow_radius))
+        for glow_radius, glow_surface in self.get_glow_surfaces(self.radius):
+            surface.blit(glow_surface, (x - glow_radius, y - glow_radius))
+
+    @classmethod
+    def get_glow_surfaces(cls, radius):
+        """Get the cached (glow_radius, surface) glow layers for a fireball radius."""
+        glows = cls._glow_cache.get(radius)
+        if glows is None:
+            glows = []
+            for i in range(3):
+                alpha = 100 - i * 30
+                glow_radius = radius + (i + 1) * 2
+                glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, (*COLOR_ORANGE, alpha), (glow_radius, glow_radius), glow_radius)
+                glows.append((glow_radius, glow_surface.convert_alpha()))
+            glows = cls._glow_cache[radius] = tuple(glows)
+        return glows
 
     def get_rect(self):
         """Get collision rectangle."""
@@ -132,15 +166,15 @@ class Enemy:
         self.color = color
         self.enemy_type = enemy_type
         self.alive = True
-        self.vx = random.choice([-1, 1]) * 0.5
+        self.vx = random.choice([-1, 1]) * ENEMY_SPEED
         self.vy = 0
 
-    def update(self):
-        """Update enemy position."""
+    def update(self, anim_phase):
+        """Update enemy position; anim_phase is the shared animation clock."""
         self.x += self.vx
 
         # Bounce off screen edges
-        if self.x <= 200 or self.x >= SCREEN_WIDTH - self.width:
+        if self.x <= ENEMY_TURN_X or self.x >= SCREEN_WIDTH - self.width:
             self.vx = -self.vx
 
     def draw(self, surface):
@@ -148,15 +182,18 @@ class Enemy:
         if not self.alive:
             return
 
-        pygame.draw.rect(surface, self.color, (int(self.x), int(self.y), self.width, self.height))
+        # Enemies stay on screen, so truncating once and adding integer
+        # offsets matches truncating each offset position
+        x, y = int(self.x), int(self.y)
+        pygame.draw.rect(surface, self.color, (x, y, self.width, self.height))
 
         # Draw face based on type
         if self.enemy_type == "goomba":
             # Eyes
-            pygame.draw.circle(surface, COLOR_WHITE, (int(self.x + 8), int(self.y + 10)), 4)
-            pygame.draw.circle(surface, COLOR_WHITE, (int(self.x + self.width - 8), int(self.y + 10)), 4)
-            pygame.draw.circle(surface, COLOR_BLACK, (int(self.x + 8), int(self.y + 10)), 2)
-            pygame.draw.circle(surface, COLOR_BLACK, (int(self.x + self.width - 8), int(self.y + 10)), 2)
+            pygame.draw.circle(surface, COLOR_WHITE, (x + 8, y + 10), 4)
+            pygame.draw.circle(surface, COLOR_WHITE, (x + self.width - 8, y + 10), 4)
+            pygame.draw.circle(surface, COLOR_BLACK, (x + 8, y + 10), 2)
+            pygame.draw.circle(surface, COLOR_BLACK, (x + self.width - 8, y + 10), 2)
             # Eyebrows
             pygame.draw.line(surface, COLOR_BLACK, (self.x + 4, self.y + 5), (self.x + 12, self.y + 8), 2)
             pygame.draw.line(surface, COLOR_BLACK, (self.x + self.width - 12, self.y + 8), (self.x + self.width - 4, self.y + 5), 2)
@@ -169,15 +206,20 @@ class Enemy:
 class PiranhaPlant(Enemy):
     """Piranha Plant enemy that stays in position."""
 
+    # The head overhangs the stem by SPRITE_TOP rows and the teeth stick out
+    # past the plant's width, so the sprite is larger than the hitbox
+    SPRITE_TOP = 22
+    SPRITE_WIDTH = 30
+    _sprite = None
+
     def __init__(self, x, y):
         super().__init__(x, y, 25, PIRANHA_HEIGHT, COLOR_RED, "piranha")
         self.anim_offset = random.random() * math.pi * 2
         self.base_y = y
 
-    def update(self):
+    def update(self, anim_phase):
         """Animate piranha plant."""
-        import time
-        offset = math.sin(time.time() * 3 + self.anim_offset) * 5
+        offset = math.sin(anim_phase + self.anim_offset) * 5
         self.y = self.base_y + offset
 
     def draw(self, surface):
@@ -185,28 +227,38 @@ class PiranhaPlant(Enemy):
         if not self.alive:
             return
 
-        # Stem
-        stem_width = 6
-        pygame.draw.rect(surface, COLOR_GREEN, (int(self.x + self.width // 2 - stem_width // 2), int(self.y), stem_width, 20))
+        surface.blit(self.get_sprite(), (int(self.x), int(self.y) - self.SPRITE_TOP))
 
-        # Head (mouth)
-        head_y = self.y - 10
-        pygame.draw.circle(surface, self.color, (int(self.x + self.width // 2), int(head_y)), self.width // 2)
+    def get_sprite(self):
+        """Get the shared pre-rendered piranha plant sprite."""
+        if PiranhaPlant._sprite is None:
+            sprite = pygame.Surface((self.SPRITE_WIDTH, self.SPRITE_TOP + 20), pygame.SRCALPHA)
 
-        # Teeth
-        for i in range(4):
-            tooth_x = self.x + 5 + i * 6
-            pygame.draw.polygon(surface, COLOR_WHITE, [
-                (tooth_x, head_y + 5),
-                (tooth_x + 3, head_y + 12),
-                (tooth_x + 6, head_y + 5)
-            ])
+            # Stem
+            stem_width = 6
+            pygame.draw.rect(sprite, COLOR_GREEN, (self.width // 2 - stem_width // 2, self.SPRITE_TOP, stem_width, 20))
 
-        # Eyes
-        pygame.draw.circle(surface, COLOR_WHITE, (int(self.x + 8), int(head_y - 3)), 4)
-        pygame.draw.circle(surface, COLOR_WHITE, (int(self.x + self.width - 8), int(head_y - 3)), 4)
-        pygame.draw.circle(surface, COLOR_BLACK, (int(self.x + 8), int(head_y - 3)), 2)
-        pygame.draw.circle(surface, COLOR_BLACK, (int(self.x + self.width - 8), int(head_y - 3)), 2)
+            # Head (mouth)
+            head_y = self.SPRITE_TOP - 10
+            pygame.draw.circle(sprite, self.color, (self.width // 2, head_y), self.width // 2)
+
+            # Teeth
+            for i in range(4):
+                tooth_x = 5 + i * 6
+                pygame.draw.polygon(sprite, COLOR_WHITE, [
+                    (tooth_x, head_y + 5),
+                    (tooth_x + 3, head_y + 12),
+                    (tooth_x + 6, head_y + 5)
+                ])
+
+            # Eyes
+            pygame.draw.circle(sprite, COLOR_WHITE, (8, head_y - 3), 4)
+            pygame.draw.circle(sprite, COLOR_WHITE, (self.width - 8, head_y - 3), 4)
+            pygame.draw.circle(sprite, COLOR_BLACK, (8, head_y - 3), 2)
+            pygame.draw.circle(sprite, COLOR_BLACK, (self.width - 8, head_y - 3), 2)
+
+            PiranhaPlant._sprite = sprite.convert_alpha()
+        return PiranhaPlant._sprite
 
 
 class Player:
@@ -242,19 +294,19 @@ class Player:
     def draw(self, surface):
         """Draw Mario."""
         # Body
-        pygame.draw.rect(surface, COLOR_RED, (int(self.x), int(self.y), self.width, self.height))
+        pygame.draw.rect(surface, COLOR_RED, (self.x, self.y, self.width, self.height))
 
         # Face
         face_x = self.x + self.width // 2
         face_y = self.y - 5
-        pygame.draw.circle(surface, COLOR_ORANGE, (int(face_x), int(face_y)), 12)
+        pygame.draw.circle(surface, COLOR_ORANGE, (face_x, face_y), 12)
 
         # Hat
-        pygame.draw.rect(surface, COLOR_RED, (int(face_x - 12), int(face_y - 15), 24, 8))
+        pygame.draw.rect(surface, COLOR_RED, (face_x - 12, face_y - 15, 24, 8))
 
         # Eyes
-        pygame.draw.circle(surface, COLOR_BLACK, (int(face_x - 4), int(face_y - 2)), 2)
-        pygame.draw.circle(surface, COLOR_BLACK, (int(face_x + 4), int(face_y - 2)), 2)
+        pygame.draw.circle(surface, COLOR_BLACK, (face_x - 4, face_y - 2), 2)
+        pygame.draw.circle(surface, COLOR_BLACK, (face_x + 4, face_y - 2), 2)
 
         # Mustache
         pygame.draw.line(surface, COLOR_BLACK, (face_x - 6, face_y + 4), (face_x + 6, face_y + 4), 2)
@@ -283,8 +335,8 @@ class Platform:
 
     def draw(self, surface):
         """Draw the platform."""
-        pygame.draw.rect(surface, COLOR_BROWN, (int(self.x), int(self.y), self.width, self.height))
-        pygame.draw.rect(surface, COLOR_DARK_GREEN, (int(self.x), int(self.y), self.width, 3))
+        pygame.draw.rect(surface, COLOR_BROWN, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(surface, COLOR_DARK_GREEN, (self.x, self.y, self.width, 3))
 
     def get_rect(self):
         """Get collision rectangle."""
@@ -301,13 +353,24 @@ class Game:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._text_cache = {}
 
         self.reset_game()
 
+    def render_text(self, text, font, color):
+        """Render text through a small LRU cache so unchanged strings are not re-rasterized."""
+        key = (text, id(font), color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        self._text_cache[key] = surface
+        return surface
+
     def reset_game(self):
         """Reset game to initial state."""
         self.player = Player()
-        self.fireballs = []
         self.enemies = []
         self.platforms = []
         self.score = 0
@@ -324,7 +387,7 @@ class Game:
         """Generate a new stage with enemies and platforms."""
         self.enemies = []
         self.platforms = []
-        self.fireballs = []
+        self.clear_fireballs()
         self.fireballs_remaining = FIREBALL_LIMIT_PER_STAGE
         self.stage_cleared = False
 
@@ -335,6 +398,7 @@ class Game:
             plat_y = random.randint(150, SCREEN_HEIGHT - 200)
             plat_width = random.randint(80, 150)
             self.platforms.append(Platform(plat_x, plat_y, plat_width))
+        self.build_platform_grid()
 
         # Generate enemies
         num_enemies = 3 + self.stage * 2
@@ -350,6 +414,110 @@ class Game:
                 enemy_y = random.randint(100, SCREEN_HEIGHT - 100)
                 self.enemies.append(Enemy(enemy_x, enemy_y, ENEMY_WIDTH, ENEMY_HEIGHT, COLOR_BROWN, "goomba"))
 
+    def build_platform_grid(self):
+        """Index the stage's static platforms by the grid cells they cover."""
+        self.platform_boxes = np.array(
+            [(p.x, p.y, p.x + p.width, p.y + p.height) for p in self.platforms],
+            dtype=np.float64).reshape(-1, 4)
+        self.platform_grid = {}
+        for i, (left_x, top_y, right_x, bottom_y) in enumerate(self.platform_boxes):
+            for cx in range(int(left_x) // PLATFORM_GRID_CELL, int(right_x) // PLATFORM_GRID_CELL + 1):
+                for cy in range(int(top_y) // PLATFORM_GRID_CELL, int(bottom_y) // PLATFORM_GRID_CELL + 1):
+                    self.platform_grid.setdefault((cx, cy), []).append(i)
+
+    def clear_fireballs(self):
+        """Allocate empty Structure-of-Arrays fireball storage for a stage."""
+        capacity = FIREBALL_LIMIT_PER_STAGE
+        self.fb_x = np.zeros(capacity, dtype=np.float64)
+        self.fb_y = np.zeros(capacity, dtype=np.float64)
+        self.fb_vx = np.zeros(capacity, dtype=np.float64)
+        self.fb_vy = np.zeros(capacity, dtype=np.float64)
+        self.fb_life = np.zeros(capacity, dtype=np.int32)
+        self.fb_bounces = np.zeros(capacity, dtype=np.int32)
+        self.fb_active = np.zeros(capacity, dtype=bool)
+        # Live fireballs are kept packed in slots [0, fb_count), in launch order
+        self.fb_count = 0
+
+    def spawn_fireball(self, x, y, angle):
+        """Launch a fireball into the next free slot."""
+        i = self.fb_count
+        if i >= len(self.fb_x):
+            return
+
+        self.fb_count += 1
+        self.fb_x[i] = x
+        self.fb_y[i] = y
+        self.fb_vx[i] = math.cos(angle) * FIREBALL_SPEED
+        self.fb_vy[i] = -math.sin(angle) * FIREBALL_SPEED
+        self.fb_life[i] = FIREBALL_LIFETIME
+        self.fb_bounces[i] = 0
+        self.fb_active[i] = True
+
+    @property
+    def fireballs(self):
+        """Views of the active fireballs, in launch order."""
+        return [Fireball(self.fb_x[i], self.fb_y[i], self.fb_vx[i], self.fb_vy[i], self.fb_bounces[i])
+                for i in np.flatnonzero(self.fb_active[:self.fb_count])]
+
+    def update_fireballs(self):
+        """Advance all active fireballs at once and handle their bounces."""
+        n = self.fb_count
+        step_fireballs(self.fb_x[:n], self.fb_y[:n], self.fb_vx[:n], self.fb_vy[:n], self.fb_life[:n],
+                       self.fb_bounces[:n], self.fb_active[:n], self.platform_boxes, self.platform_grid)
+
+    def compact_fireballs(self):
+        """Drop dead fireballs by packing the live ones to the front, in order."""
+        n = self.fb_count
+        keep = self.fb_active[:n]
+        if keep.all():
+            return
+
+        live = int(np.count_nonzero(keep))
+        for arr in (self.fb_x, self.fb_y, self.fb_vx, self.fb_vy, self.fb_life, self.fb_bounces):
+            arr[:live] = arr[:n][keep]
+        self.fb_active[:live] = True
+        self.fb_active[live:n] = False
+        self.fb_count = live
+
+    def check_fireball_hits(self):
+        """Resolve fireball-enemy hits with one broadcast overlap test."""
+        n = self.fb_count
+        if not self.enemies or not self.fb_active[:n].any():
+            return
+
+        # Same integer boxes and strict overlap test as pygame.Rect.colliderect
+        r = FIREBALL_RADIUS
+        fb_left = np.trunc(self.fb_x[:n] - r)
+        fb_top = np.trunc(self.fb_y[:n] - r)
+        boxes = np.array([(e.x, e.y, e.width, e.height) for e in self.enemies], dtype=np.float64)
+        en_left = np.trunc(boxes[:, 0])
+        en_top = np.trunc(boxes[:, 1])
+
+        hit = (self.fb_active[:n, None] &
+               (fb_left[:, None] < en_left + boxes[:, 2]) &
+               (fb_left[:, None] + r * 2 > en_left) &
+               (fb_top[:, None] < en_top + boxes[:, 3]) &
+               (fb_top[:, None] + r * 2 > en_top))
+
+        # Each fireball takes the first enemy it overlaps that is still alive
+        killed = set()
+        for i in np.flatnonzero(hit.any(axis=1)):
+            for j in np.flatnonzero(hit[i]):
+                if j in killed:
+                    continue
+
+                # Calculate score based on bounces
+                bounce_bonus = 1 + (self.fb_bounces[i] * 0.5)
+                points = int(ENEMY_COLLISION_SCORE * bounce_bonus)
+                self.score += points
+
+                killed.add(j)
+                self.fb_active[i] = False
+                break
+
+        if killed:
+            self.enemies = [e for j, e in enumerate(self.enemies) if j not in killed]
+
     def handle_input(self):
         """Handle keyboard input."""
         keys = pygame.key.get_pressed()
@@ -371,7 +539,7 @@ class Game:
                 if event.key == pygame.K_SPACE and not self.game_over and not self.stage_cleared:
                     if self.fireballs_remaining > 0:
                         spawn_x, spawn_y = self.player.get_fireball_spawn_position()
-                        self.fireballs.append(Fireball(spawn_x, spawn_y, self.player.arm_angle))
+                        self.spawn_fireball(spawn_x, spawn_y, self.player.arm_angle)
                         self.fireballs_remaining -= 1
                 elif event.key == pygame.K_r:
                     if self.game_over:
@@ -394,39 +562,33 @@ class Game:
             self.generate_stage()
             return
 
-        # Update enemies
+        # Update enemies, sampling the animation clock once per frame
+        anim_phase = time.time() * 3
         for enemy in self.enemies:
-            enemy.update()
-
-            # Check if enemy reached player
-            if enemy.x <= self.player.x + self.player.width:
-                self.lives -= 1
-                self.enemies.remove(enemy)
-                if self.lives <= 0:
-                    self.game_over = True
+            enemy.update(anim_phase)
+
+        # Check if any enemy reached the player. Enemies never get more than
+        # one step past ENEMY_TURN_X, so the scan is skipped while the player
+        # stays left of that
+        player_right = self.player.x + self.player.width
+        if player_right >= ENEMY_TURN_X - ENEMY_SPEED:
+            reached_player = False
+            for enemy in self.enemies:
+                if enemy.x <= player_right:
+                    self.lives -= 1
+                    enemy.alive = False
+                    reached_player = True
+                    if self.lives <= 0:
+                        self.game_over = True
+            if reached_player:
+                self.enemies = [e for e in self.enemies if e.alive]
 
         # Update fireballs
-        for fireball in self.fireballs[:]:
-            fireball.update(self.platforms)
-
-            if not fireball.active:
-                if fireball in self.fireballs:
-                    self.fireballs.remove(fireball)
-                continue
-
-            # Check collision with enemies
-            fireball_rect = fireball.get_rect()
-            for enemy in self.enemies[:]:
-                enemy_rect = enemy.get_rect()
-                if fireball_rect.colliderect(enemy_rect):
-                    # Calculate score based on bounces
-                    bounce_bonus = 1 + (fireball.bounces * 0.5)
-                    points = int(ENEMY_COLLISION_SCORE * bounce_bonus)
-                    self.score += points
-
-                    self.enemies.remove(enemy)
-                    self.fireballs.remove(fireball)
-                    break
+        self.update_fireballs()
+
+        # Check collision with enemies
+        self.check_fireball_hits()
+        self.compact_fireballs()
 
         # Check stage clear
         if not self.enemies:
@@ -436,7 +598,7 @@ class Game:
         # Check game over (out of fireballs and enemies remain)
         if not self.enemies:
             pass  # Stage cleared
-        elif self.fireballs_remaining == 0 and not self.fireballs:
+        elif self.fireballs_remaining == 0 and self.fb_count == 0:
             self.game_over = True
             self.won = False
 
@@ -470,10 +632,10 @@ class Game:
         pygame.draw.line(self.screen, COLOR_GRAY, (spawn_x, spawn_y), (guide_x, guide_y), 2)
 
         # Draw UI
-        score_text = self.font.render(f"Score: {self.score}", True, COLOR_WHITE)
-        stage_text = self.font.render(f"Stage: {self.stage}", True, COLOR_WHITE)
-        fireballs_text = self.font.render(f"Fireballs: {self.fireballs_remaining}", True, COLOR_ORANGE)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, COLOR_RED)
+        score_text = self.render_text(f"Score: {self.score}", self.font, COLOR_WHITE)
+        stage_text = self.render_text(f"Stage: {self.stage}", self.font, COLOR_WHITE)
+        fireballs_text = self.render_text(f"Fireballs: {self.fireballs_remaining}", self.font, COLOR_ORANGE)
+        lives_text = self.render_text(f"Lives: {self.lives}", self.font, COLOR_RED)
 
         self.screen.blit(score_text, (20, 10))
         self.screen.blit(stage_text, (20, 50))
@@ -483,7 +645,7 @@ class Game:
         # Draw stage cleared message
         if self.stage_cleared:
             msg = f"STAGE {self.stage - 1} CLEARED!"
-            text = self.font.render(msg, True, COLOR_GREEN)
+            text = self.render_text(msg, self.font, COLOR_GREEN)
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             pygame.draw.rect(self.screen, COLOR_BLACK, rect.inflate(20, 10))
             self.screen.blit(text, rect)
@@ -491,7 +653,7 @@ class Game:
         # Draw game over message
         if self.game_over and not self.stage_cleared:
             msg = "GAME OVER! Press R to restart"
-            text = self.font.render(msg, True, COLOR_RED)
+            text = self.render_text(msg, self.font, COLOR_RED)
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             pygame.draw.rect(self.screen, COLOR_BLACK, rect.inflate(20, 10))
             self.screen.blit(text, rect)
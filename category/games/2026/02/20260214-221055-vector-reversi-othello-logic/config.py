@@ -39,6 +39,10 @@ DIRECTIONS = [
 FONT_SIZE_LARGE = 36
 FONT_SIZE_MEDIUM = 24
 FONT_SIZE_SMALL = 18
+TEXT_CACHE_SIZE = 64  # Rendered text surfaces kept between frames
+
+# Positions whose valid-move lists are remembered
+MOVES_CACHE_SIZE = 256
 
 # Animation settings
 FLIP_DELAY = 100  # ms between piece flips in animation
@@ -5,6 +5,54 @@ import pygame
 from config import *
 
 
+# Bitboards hold one bit per cell at index row * GRID_SIZE + col
+FULL_BOARD = (1 << (GRID_SIZE * GRID_SIZE)) - 1
+NOT_FIRST_COL = 0xfefefefefefefefe
+NOT_LAST_COL = 0x7f7f7f7f7f7f7f7f
+
+# Screen rect of each cell and of the panel, and piece drawing sizes
+CELL_RECTS = tuple(tuple(pygame.Rect(col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                         for col in range(GRID_SIZE))
+                   for row in range(GRID_SIZE))
+PANEL_RECT = pygame.Rect(0, BOARD_SIZE, SCREEN_WIDTH, SIDE_PANEL_HEIGHT)
+PIECE_RADIUS = CELL_SIZE // 2 - 5
+PIECE_OUTLINE_WIDTH = 2
+HINT_RADIUS = 10
+
+# Per direction, the (left, right, mask) that move a bitboard one cell along it
+# as ((bb << left) >> right) & mask, so the hot loops never branch on (dx, dy)
+DIRECTION_SHIFTS = tuple(
+    (max(step, 0), max(-step, 0),
+     FULL_BOARD & (NOT_FIRST_COL if dy == 1 else NOT_LAST_COL if dy == -1 else FULL_BOARD))
+    for dx, dy in DIRECTIONS
+    for step in (dx * GRID_SIZE + dy,)
+)
+
+
+def bit_cell(bit):
+    """Convert a single-bit bitboard to its (row, col)."""
+    return divmod(bit.bit_length() - 1, GRID_SIZE)
+
+
+def build_rays(row, col):
+    """List the (bit, (row, col)) cells out to the edge in each direction from a cell."""
+    rays = []
+    for dx, dy in DIRECTIONS:
+        ray = []
+        r, c = row + dx, col + dy
+        while 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE:
+            ray.append((1 << (r * GRID_SIZE + c), (r, c)))
+            r, c = r + dx, c + dy
+        if ray:
+            rays.append(tuple(ray))
+    return tuple(rays)
+
+
+# Rays from every cell, indexed by bit position, so flip detection walks
+# plain tuples with no bounds checks or shifts
+RAYS = tuple(build_rays(row, col) for row in range(GRID_SIZE) for col in range(GRID_SIZE))
+
+
 class ReversiGame:
     """Main Reversi/Othello game class."""
 
@@ -17,12 +65,28 @@ class ReversiGame:
         self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
         self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
         self.font_small = pygame.font.Font(None, FONT_SIZE_SMALL)
+        self._text_cache = {}
+        self._moves_cache = {}
+        self.board_bg = self.render_board_background()
+        self.cell_sprites = self.render_cell_sprites()
 
         self.reset_game()
 
+    def render_text(self, text, font, color):
+        """Render text through a small LRU cache so unchanged strings are not re-rasterized."""
+        key = (text, id(font), color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        self._text_cache[key] = surface
+        return surface
+
     def reset_game(self):
         """Reset the game to initial state."""
-        self.board = [[EMPTY for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        self.black_bb = 0
+        self.white_bb = 0
         self.current_player = BLACK
         self.game_over = False
         self.winner = None
@@ -33,50 +97,108 @@ class ReversiGame:
         self.flip_index = 0
         self.hover_pos = None
 
+        # What each cell and the panel currently show on screen; None forces
+        # a full repaint on the next frame
+        self._drawn_cells = None
+        self._drawn_panel = None
+
         # Initialize starting position
         mid = GRID_SIZE // 2
-        self.board[mid - 1][mid - 1] = WHITE
-        self.board[mid - 1][mid] = BLACK
-        self.board[mid][mid - 1] = BLACK
-        self.board[mid][mid] = WHITE
+        self.set_piece(mid - 1, mid - 1, WHITE)
+        self.set_piece(mid - 1, mid, BLACK)
+        self.set_piece(mid, mid - 1, BLACK)
+        self.set_piece(mid, mid, WHITE)
 
         self.calculate_valid_moves()
 
+    @property
+    def board(self):
+        """List-of-lists view of the bitboards (EMPTY, BLACK or WHITE per cell)."""
+        board = [[EMPTY] * GRID_SIZE for _ in range(GRID_SIZE)]
+        for row in range(GRID_SIZE):
+            for col in range(GRID_SIZE):
+                bit = 1 << (row * GRID_SIZE + col)
+                if self.black_bb & bit:
+                    board[row][col] = BLACK
+                elif self.white_bb & bit:
+                    board[row][col] = WHITE
+        return board
+
+    def set_piece(self, row, col, player):
+        """Place or flip a piece to the given player's color."""
+        bit = 1 << (row * GRID_SIZE + col)
+        if player == BLACK:
+            self.black_bb |= bit
+            self.white_bb &= ~bit
+        else:
+            self.white_bb |= bit
+            self.black_bb &= ~bit
+
+    def get_bitboards(self, player):
+        """Get the (own, opponent) bitboards for a player."""
+        if player == BLACK:
+            return self.black_bb, self.white_bb
+        return self.white_bb, self.black_bb
+
     def is_on_board(self, row, col):
         """Check if position is on the board."""
         return 0 <= row < GRID_SIZE and 0 <= col < GRID_SIZE
 
     def get_flippable_pieces(self, row, col, player):
         """Get all pieces that would be flipped by placing at (row, col)."""
-        if self.board[row][col] != EMPTY:
+        index = row * GRID_SIZE + col
+        if (self.black_bb | self.white_bb) & (1 << index):
             return []
 
-        opponent = WHITE if player == BLACK else BLACK
+        own, opponent = self.get_bitboards(player)
         all_flippable = []
 
-        for dx, dy in DIRECTIONS:
+        for ray in RAYS[index]:
             flippable = []
-            r, c = row + dx, col + dy
-
-            while self.is_on_board(r, c) and self.board[r][c] == opponent:
-                flippable.append((r, c))
-                r += dx
-                c += dy
-
-            if (flippable and self.is_on_board(r, c) and
-                    self.board[r][c] == player):
-                all_flippable.extend(flippable)
+            for bit, cell in ray:
+                if bit & opponent:
+                    flippable.append(cell)
+                    continue
+                if flippable and bit & own:
+                    all_flippable.extend(flippable)
+                break
 
         return all_flippable
 
     def calculate_valid_moves(self):
         """Calculate all valid moves for the current player."""
+        key = (self.black_bb, self.white_bb, self.current_player)
+        cached = self._moves_cache.get(key)
+        if cached is not None:
+            self.valid_moves = cached
+            return
+
+        own, opponent = self.get_bitboards(self.current_player)
+        empty = ~(own | opponent) & FULL_BOARD
+
+        # Kogge-Stone fill: grow runs of opponent pieces outward from our own
+        # pieces in each direction, doubling the reach each step (1, 2, 4
+        # cells); an empty cell just past a run is a legal move
+        moves = 0
+        for left, right, mask in DIRECTION_SHIFTS:
+            run = opponent & ((own << left) >> right) & mask
+            through = opponent & mask
+            run |= through & ((run << left) >> right)
+            through &= (through << left) >> right
+            run |= through & ((run << 2 * left) >> 2 * right)
+            through &= (through << 2 * left) >> 2 * right
+            run |= through & ((run << 4 * left) >> 4 * right)
+            moves |= empty & ((run << left) >> right) & mask
+
         self.valid_moves = []
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                flippable = self.get_flippable_pieces(row, col, self.current_player)
-                if flippable:
-                    self.valid_moves.append((row, col))
+        while moves:
+            bit = moves & -moves
+            self.valid_moves.append(bit_cell(bit))
+            moves ^= bit
+
+        if len(self._moves_cache) >= MOVES_CACHE_SIZE:
+            del self._moves_cache[next(iter(self._moves_cache))]
+        self._moves_cache[key] = self.valid_moves
 
     def make_move(self, row, col):
         """Make a move at the given position."""
@@ -84,7 +206,7 @@ class ReversiGame:
             return False
 
         flippable = self.get_flippable_pieces(row, col, self.current_player)
-        self.board[row][col] = self.current_player
+        self.set_piece(row, col, self.current_player)
 
         if flippable:
             self.pieces_to_flip = flippable
@@ -105,7 +227,7 @@ class ReversiGame:
         if current_time - self.flip_timer >= FLIP_DELAY:
             if self.flip_index < len(self.pieces_to_flip):
                 row, col = self.pieces_to_flip[self.flip_index]
-                self.board[row][col] = self.current_player
+                self.set_piece(row, col, self.current_player)
                 self.flip_index += 1
                 self.flip_timer = current_time
             else:
@@ -130,8 +252,7 @@ class ReversiGame:
     def end_game(self):
         """End the game and determine winner."""
         self.game_over = True
-        black_count = sum(row.count(BLACK) for row in self.board)
-        white_count = sum(row.count(WHITE) for row in self.board)
+        black_count, white_count = self.get_score()
 
         if black_count > white_count:
             self.winner = "Black"
@@ -142,9 +263,7 @@ class ReversiGame:
 
     def get_score(self):
         """Get current score."""
-        black_count = sum(row.count(BLACK) for row in self.board)
-        white_count = sum(row.count(WHITE) for row in self.board)
-        return black_count, white_count
+        return self.black_bb.bit_count(), self.white_bb.bit_count()
 
     def handle_event(self, event):
         """Handle pygame events."""
@@ -180,69 +299,110 @@ class ReversiGame:
 
         return True
 
-    def draw_board(self):
-        """Draw the game board."""
-        self.screen.fill(COLOR_BG)
-
-        # Draw grid lines
+    def render_board_background(self):
+        """Pre-render the empty board with its grid lines."""
+        background = pygame.Surface((BOARD_SIZE, BOARD_SIZE))
+        background.fill(COLOR_BG)
         for i in range(GRID_SIZE + 1):
             pos = i * CELL_SIZE
-            pygame.draw.line(self.screen, COLOR_GRID, (pos, 0), (pos, BOARD_SIZE), 2)
-            pygame.draw.line(self.screen, COLOR_GRID, (0, pos), (BOARD_SIZE, pos), 2)
+            pygame.draw.line(background, COLOR_GRID, (pos, 0), (pos, BOARD_SIZE), 2)
+            pygame.draw.line(background, COLOR_GRID, (0, pos), (BOARD_SIZE, pos), 2)
+        return background.convert()
+
+    def render_cell_sprites(self):
+        """Pre-render the contents of a non-empty cell, keyed by (piece, hint color)."""
+        center = (CELL_SIZE // 2, CELL_SIZE // 2)
+        sprites = {}
+        for piece, color in ((BLACK, COLOR_BLACK), (WHITE, COLOR_WHITE)):
+            sprite = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, center, PIECE_RADIUS)
+            pygame.draw.circle(sprite, COLOR_GRID, center, PIECE_RADIUS, PIECE_OUTLINE_WIDTH)
+            sprites[(piece, None)] = sprite.convert_alpha()
+        for color in (COLOR_HINT, COLOR_HINT_HOVER):
+            sprite = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, center, HINT_RADIUS)
+            sprites[(EMPTY, color)] = sprite.convert_alpha()
+        return sprites
 
-        # Draw valid move hints
+    def draw_board(self):
+        """Draw the game board, repainting only cells that changed; returns their rects."""
+        hints = {}
         if not self.flip_animation and not self.game_over:
-            for row, col in self.valid_moves:
-                center_x = col * CELL_SIZE + CELL_SIZE // 2
-                center_y = row * CELL_SIZE + CELL_SIZE // 2
-                color = COLOR_HINT_HOVER if self.hover_pos == (row, col) else COLOR_HINT
-                pygame.draw.circle(self.screen, color, (center_x, center_y), 10)
-
-        # Draw pieces
+            for move in self.valid_moves:
+                hints[move] = COLOR_HINT_HOVER if self.hover_pos == move else COLOR_HINT
+
+        full = self._drawn_cells is None
+        if full:
+            self.screen.blit(self.board_bg, (0, 0))
+            self._drawn_cells = {}
+
+        # Restore the background under changed cells, then stamp their
+        # sprites, all in one blits call
+        dirty = []
+        restores = []
+        sprites = []
         for row in range(GRID_SIZE):
             for col in range(GRID_SIZE):
-                if self.board[row][col] != EMPTY:
-                    center_x = col * CELL_SIZE + CELL_SIZE // 2
-                    center_y = row * CELL_SIZE + CELL_SIZE // 2
-                    color = COLOR_BLACK if self.board[row][col] == BLACK else COLOR_WHITE
-                    pygame.draw.circle(self.screen, color, (center_x, center_y), CELL_SIZE // 2 - 5)
-                    pygame.draw.circle(self.screen, COLOR_GRID, (center_x, center_y), CELL_SIZE // 2 - 5, 2)
+                bit = 1 << (row * GRID_SIZE + col)
+                piece = BLACK if self.black_bb & bit else WHITE if self.white_bb & bit else EMPTY
+                cell = (piece, hints.get((row, col)))
+                if self._drawn_cells.get((row, col)) == cell:
+                    continue
+                self._drawn_cells[(row, col)] = cell
+
+                rect = CELL_RECTS[row][col]
+                if not full:
+                    restores.append((self.board_bg, rect, rect))
+                sprite = self.cell_sprites.get(cell)
+                if sprite is not None:
+                    sprites.append((sprite, rect))
+                dirty.append(rect)
+
+        self.screen.blits(restores + sprites, doreturn=False)
+        return dirty
 
     def draw_panel(self):
-        """Draw the info panel."""
-        panel_rect = pygame.Rect(0, BOARD_SIZE, SCREEN_WIDTH, SIDE_PANEL_HEIGHT)
-        pygame.draw.rect(self.screen, COLOR_PANEL, panel_rect)
-
+        """Draw the info panel if its contents changed; returns the dirty rects."""
         black_count, white_count = self.get_score()
+        panel = (black_count, white_count, self.current_player, self.game_over, self.winner)
+        if panel == self._drawn_panel:
+            return []
+        self._drawn_panel = panel
+
+        pygame.draw.rect(self.screen, COLOR_PANEL, PANEL_RECT)
 
         # Draw scores
-        black_text = self.font_medium.render(f"Black: {black_count}", True, COLOR_TEXT)
-        white_text = self.font_medium.render(f"White: {white_count}", True, COLOR_TEXT)
+        black_text = self.render_text(f"Black: {black_count}", self.font_medium, COLOR_TEXT)
+        white_text = self.render_text(f"White: {white_count}", self.font_medium, COLOR_TEXT)
         self.screen.blit(black_text, (50, BOARD_SIZE + 20))
         self.screen.blit(white_text, (50, BOARD_SIZE + 55))
 
         # Draw current turn
         if not self.game_over:
             turn_text = "Black's Turn" if self.current_player == BLACK else "White's Turn"
-            turn_surface = self.font_large.render(turn_text, True, COLOR_TEXT)
+            turn_surface = self.render_text(turn_text, self.font_large, COLOR_TEXT)
             self.screen.blit(turn_surface, (SCREEN_WIDTH // 2 - turn_surface.get_width() // 2, BOARD_SIZE + 35))
         else:
             if self.winner == "Tie":
                 result_text = "Game Over - It's a Tie!"
             else:
                 result_text = f"Game Over - {self.winner} Wins!"
-            result_surface = self.font_large.render(result_text, True, COLOR_VALID_MOVE)
+            result_surface = self.render_text(result_text, self.font_large, COLOR_VALID_MOVE)
             self.screen.blit(result_surface, (SCREEN_WIDTH // 2 - result_surface.get_width() // 2, BOARD_SIZE + 35))
 
         # Draw controls hint
-        hint_text = self.font_small.render("R: Restart | ESC: Quit", True, COLOR_TEXT)
+        hint_text = self.render_text("R: Restart | ESC: Quit", self.font_small, COLOR_TEXT)
         self.screen.blit(hint_text, (SCREEN_WIDTH - hint_text.get_width() - 20, BOARD_SIZE + 40))
+        return [PANEL_RECT]
 
     def draw(self):
-        """Draw everything."""
-        self.draw_board()
-        self.draw_panel()
-        pygame.display.flip()
+        """Draw everything, pushing only the changed regions to the display."""
+        full = self._drawn_cells is None
+        dirty = self.draw_board() + self.draw_panel()
+        if full:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
 
     def run(self):
         """Main game loop."""
@@ -1,6 +1,7 @@
 """Game entities for Vector Hextris."""
 
 import math
+import re
 import pygame
 from config import (
     HEXAGON_RADIUS,
@@ -9,9 +10,24 @@ from config import (
     BLOCK_HEIGHT,
     BLOCKS_PER_ROW,
     BLOCK_COLORS,
+    MATCH_MIN,
 )
 
 
+# A regular hexagon's sides are as long as its radius
+INV_SIDE_LENGTH = 1.0 / HEXAGON_RADIUS
+
+# A run of MATCH_MIN or more equal color bytes
+MATCH_RUN = re.compile(rb"(.)\1{%d,}" % (MATCH_MIN - 1), re.DOTALL)
+
+
+def find_runs(colors):
+    """Return the (start, end) index ranges of matching color runs on a side."""
+    if len(colors) < MATCH_MIN:
+        return []
+    return [run.span() for run in MATCH_RUN.finditer(colors)]
+
+
 class Block:
     """A single colored block in the game."""
 
@@ -26,98 +42,126 @@ class Block:
 class FallingBar:
     """A falling bar consisting of multiple blocks."""
 
+    # Every block of a bar shares its color and size; only the offset along
+    # the side differs, and that is the same for every bar
+    offsets = tuple((i - BLOCKS_PER_ROW // 2) * (BLOCK_WIDTH + 2) for i in range(BLOCKS_PER_ROW))
+    width = BLOCK_WIDTH
+    height = BLOCK_HEIGHT
+
     def __init__(self, side_index, color_index):
         self.side_index = side_index
         self.color_index = color_index
         self.distance = 350  # Starting distance from center
-        self.blocks = []
-        # Create blocks for the bar
-        for i in range(BLOCKS_PER_ROW):
-            offset = (i - BLOCKS_PER_ROW // 2) * (BLOCK_WIDTH + 2)
-            self.blocks.append({
-                'color_index': color_index,
-                'offset': offset,
-                'width': BLOCK_WIDTH,
-                'height': BLOCK_HEIGHT
-            })
 
 
 class Hexagon:
     """The central hexagon that holds stacked blocks."""
 
+    # Geometry tables by (center_x, center_y, rotation); rotation only takes
+    # six values, so the trig runs at most six times per center
+    _geometry_cache = {}
+
     def __init__(self, center_x, center_y):
         self.center_x = center_x
         self.center_y = center_y
         self.rotation = 0  # Current rotation in degrees
         self.sides = [[] for _ in range(HEXAGON_SIDES)]  # Each side holds blocks
+        # Color index of each block on each side, kept in step with self.sides
+        self.side_colors = [bytearray() for _ in range(HEXAGON_SIDES)]
+        # Sides changed since check_matches last looked at them
+        self.side_changed = [False] * HEXAGON_SIDES
+        self._rebuild_geometry()
 
     def rotate(self, direction):
         """Rotate the hexagon. Direction: -1 for left, 1 for right."""
         self.rotation = (self.rotation + direction * 60) % 360
+        self._rebuild_geometry()
+
+    def _rebuild_geometry(self):
+        """Load the vertex, side and normal tables for the current rotation."""
+        key = (self.center_x, self.center_y, self.rotation)
+        geometry = self._geometry_cache.get(key)
+        if geometry is None:
+            geometry = self._geometry_cache[key] = self._compute_geometry()
+        (self._vertices, self._side_vertices, self._side_centers,
+         self._side_dirs, self._normals) = geometry
+
+    def _compute_geometry(self):
+        """Compute the vertex, side and normal tables for the current rotation."""
+        vertices = []
+        side_vertices = []
+        side_centers = []
+        side_dirs = []
+        normals = []
+        for i in range(HEXAGON_SIDES):
+            angle_start = math.radians(self.rotation + i * 60 - 30)
+            angle_end = math.radians(self.rotation + (i + 1) * 60 - 30)
+
+            x1 = self.center_x + HEXAGON_RADIUS * math.cos(angle_start)
+            y1 = self.center_y + HEXAGON_RADIUS * math.sin(angle_start)
+            x2 = self.center_x + HEXAGON_RADIUS * math.cos(angle_end)
+            y2 = self.center_y + HEXAGON_RADIUS * math.sin(angle_end)
+            vertices.append((x1, y1))
+            side_vertices.append(((x1, y1), (x2, y2)))
+            side_centers.append(((x1 + x2) / 2, (y1 + y2) / 2))
+
+            side_dirs.append(((x2 - x1) * INV_SIDE_LENGTH, (y2 - y1) * INV_SIDE_LENGTH))
+
+            angle = math.radians(self.rotation + i * 60)
+            normals.append((math.cos(angle), math.sin(angle)))
+
+        return (tuple(vertices), tuple(side_vertices), tuple(side_centers),
+                tuple(side_dirs), tuple(normals))
 
     def add_block_to_side(self, side_index, block):
         """Add a block to the specified side."""
         self.sides[side_index].append(block)
+        self.side_colors[side_index].append(block.color_index)
+        self.side_changed[side_index] = True
+
+    def remove_blocks(self, side_index, block_indices):
+        """Remove the blocks at the given positions on a side in one pass."""
+        removed = set(block_indices)
+        blocks = self.sides[side_index]
+        colors = self.side_colors[side_index]
+        keep = [i for i in range(len(blocks)) if i not in removed]
+        self.sides[side_index] = [blocks[i] for i in keep]
+        self.side_colors[side_index] = bytearray(colors[i] for i in keep)
+        self.side_changed[side_index] = True
 
     def get_side_vertices(self, side_index):
         """Get the vertices for a specific side of the hexagon."""
-        angle_start = math.radians(self.rotation + side_index * 60 - 30)
-        angle_end = math.radians(self.rotation + (side_index + 1) * 60 - 30)
-
-        x1 = self.center_x + HEXAGON_RADIUS * math.cos(angle_start)
-        y1 = self.center_y + HEXAGON_RADIUS * math.sin(angle_start)
-        x2 = self.center_x + HEXAGON_RADIUS * math.cos(angle_end)
-        y2 = self.center_y + HEXAGON_RADIUS * math.sin(angle_end)
-
-        return (x1, y1), (x2, y2)
+        return self._side_vertices[side_index]
 
     def get_side_normal(self, side_index):
         """Get the normal vector (pointing inward) for a side."""
-        angle = math.radians(self.rotation + side_index * 60)
-        return math.cos(angle), math.sin(angle)
+        return self._normals[side_index]
 
     def get_side_center(self, side_index):
         """Get the center point of a side."""
-        (x1, y1), (x2, y2) = self.get_side_vertices(side_index)
-        return (x1 + x2) / 2, (y1 + y2) / 2
+        return self._side_centers[side_index]
+
+    def get_side_direction(self, side_index):
+        """Get the unit vector running along a side from its first vertex."""
+        return self._side_dirs[side_index]
 
     def get_hexagon_vertices(self):
         """Get all vertices of the hexagon for drawing."""
-        vertices = []
-        for i in range(HEXAGON_SIDES):
-            angle = math.radians(self.rotation + i * 60 - 30)
-            x = self.center_x + HEXAGON_RADIUS * math.cos(angle)
-            y = self.center_y + HEXAGON_RADIUS * math.sin(angle)
-            vertices.append((x, y))
-        return vertices
+        return self._vertices
 
     def check_matches(self):
-        """Check for matching blocks on all sides and return matches found."""
-        matches = []
+        """Check for matching blocks and return {side index: block indices to clear}."""
+        matches = {}
 
-        # Check each side for consecutive blocks of same color
-        for side_idx, blocks in enumerate(self.sides):
-            if len(blocks) < 3:
+        # Only sides changed since the last check can hold a new run
+        for side_idx, colors in enumerate(self.side_colors):
+            if not self.side_changed[side_idx]:
                 continue
+            self.side_changed[side_idx] = False
 
-            # Check for runs of same color
-            i = 0
-            while i < len(blocks):
-                color = blocks[i].color_index
-                count = 1
-                j = i + 1
-
-                while j < len(blocks) and blocks[j].color_index == color:
-                    count += 1
-                    j += 1
-
-                if count >= 3:
-                    match_blocks = []
-                    for k in range(i, j):
-                        match_blocks.append((side_idx, k))
-                    matches.append(match_blocks)
-
-                i = j
+            indices = [k for start, end in find_runs(colors) for k in range(start, end)]
+            if indices:
+                matches[side_idx] = indices
 
         return matches
 
@@ -1,12 +1,18 @@
 """Main game logic for Vector Hextris."""
 
-import math
+import functools
 import random
 import pygame
 from config import *
 from entities import Block, FallingBar, Hexagon
 
 
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface for repeated strings."""
+    return font.render(text, True, color)
+
+
 class Game:
     """Main game class managing state, rendering, and input."""
 
@@ -21,6 +27,20 @@ class Game:
 
         self.center_x = SCREEN_WIDTH // 2
         self.center_y = SCREEN_HEIGHT // 2
+        self._backdrop = (None, None)
+        self._speed_surf_cache = (None, None)
+        self._height_surf_cache = (None, None)
+
+        # Solid tile per block color, blitted for the axis-aligned falling blocks
+        self.block_tiles = []
+        for color in BLOCK_COLORS:
+            tile = pygame.Surface((BLOCK_WIDTH, BLOCK_HEIGHT)).convert()
+            tile.fill(color)
+            self.block_tiles.append(tile)
+
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game_over_overlay.set_alpha(180)
+        self.game_over_overlay.fill((0, 0, 0))
 
         self.reset()
 
@@ -33,6 +53,7 @@ class Game:
         self.spawn_timer = 0
         self.fall_speed = FALL_SPEED_INITIAL
         self.spawn_interval = SPAWN_INTERVAL_INITIAL
+        self._dirty = True
 
     def handle_input(self):
         """Handle keyboard input."""
@@ -40,6 +61,9 @@ class Game:
             if event.type == pygame.QUIT:
                 return False
 
+            if event.type == pygame.VIDEOEXPOSE:
+                self._dirty = True
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
@@ -65,7 +89,7 @@ class Game:
 
     def update_falling_bars(self):
         """Update positions of falling bars and check collisions."""
-        bars_to_remove = []
+        remaining_bars = []
 
         for bar in self.falling_bars:
             bar.distance -= self.fall_speed
@@ -73,37 +97,29 @@ class Game:
             # Check if bar reached the hexagon
             if bar.distance <= HEXAGON_RADIUS:
                 # Add blocks to the corresponding side
-                for block_data in bar.blocks:
-                    block = Block(block_data['color_index'], bar.side_index, 0)
+                for _ in bar.offsets:
+                    block = Block(bar.color_index, bar.side_index, 0)
                     self.hexagon.add_block_to_side(bar.side_index, block)
 
-                bars_to_remove.append(bar)
-
                 # Check for game over
                 if self.hexagon.get_max_stack_height() > MAX_STACK_HEIGHT:
                     self.game_over = True
+            else:
+                remaining_bars.append(bar)
 
-        # Remove collided bars
-        for bar in bars_to_remove:
-            self.falling_bars.remove(bar)
+        # Keep only the bars still falling
+        self.falling_bars = remaining_bars
 
     def check_and_clear_matches(self):
         """Check for matching blocks and clear them."""
         matches = self.hexagon.check_matches()
         if matches:
-            # Create a set of blocks to remove
-            to_remove = set()
-            for match in matches:
-                for side_idx, block_idx in match:
-                    to_remove.add((side_idx, block_idx))
-
-            # Remove blocks from each side (in reverse order to maintain indices)
-            for side_idx, block_idx in sorted(to_remove, reverse=True):
-                if block_idx < len(self.hexagon.sides[side_idx]):
-                    self.hexagon.sides[side_idx].pop(block_idx)
+            # Remove blocks side by side, rebuilding each side once
+            for side_idx, block_indices in matches.items():
+                self.hexagon.remove_blocks(side_idx, block_indices)
 
             # Calculate score
-            blocks_cleared = len(to_remove)
+            blocks_cleared = sum(len(block_indices) for block_indices in matches.values())
             self.score += int(blocks_cleared * SCORE_PER_BLOCK * (1 + self.fall_speed * 0.2))
 
     def update(self):
@@ -111,6 +127,9 @@ class Game:
         if self.game_over:
             return
 
+        # Bars move every frame while playing, so the scene always changes
+        self._dirty = True
+
         # Increase speed over time
         if self.fall_speed < FALL_SPEED_MAX:
             self.fall_speed += SPEED_INCREASE_RATE
@@ -131,32 +150,56 @@ class Game:
         # Check for matches
         self.check_and_clear_matches()
 
-    def draw_hexagon(self):
+    def draw_hexagon(self, surface):
         """Draw the central hexagon."""
         vertices = self.hexagon.get_hexagon_vertices()
-        pygame.draw.polygon(self.screen, COLOR_HEXAGON, vertices)
-        pygame.draw.polygon(self.screen, COLOR_HEXAGON_BORDER, vertices, 3)
+        pygame.draw.polygon(surface, COLOR_HEXAGON, vertices)
+        pygame.draw.polygon(surface, COLOR_HEXAGON_BORDER, vertices, 3)
+
+    def get_backdrop(self, with_limit_line):
+        """Get the background, limit line and hexagon pre-rendered as one surface.
+
+        Only the latest backdrop is kept; it is redrawn when the hexagon
+        rotates or the limit line is shown or hidden.
+        """
+        key = (self.hexagon.get_hexagon_vertices(), with_limit_line)
+        if self._backdrop[0] != key:
+            backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            backdrop.fill(COLOR_BG)
+            if with_limit_line:
+                self.draw_limit_line(backdrop)
+            self.draw_hexagon(backdrop)
+            self._backdrop = (key, backdrop)
+        return self._backdrop[1]
 
     def draw_stacked_blocks(self):
         """Draw blocks stacked on hexagon sides."""
         for side_idx, blocks in enumerate(self.hexagon.sides):
-            (x1, y1), (x2, y2) = self.hexagon.get_side_vertices(side_idx)
+            center_x, center_y = self.hexagon.get_side_center(side_idx)
+            side_dx, side_dy = self.hexagon.get_side_direction(side_idx)
             normal = self.hexagon.get_side_normal(side_idx)
 
-            # Calculate side direction vector
-            side_dx = x2 - x1
-            side_dy = y2 - y1
-            side_length = math.sqrt(side_dx ** 2 + side_dy ** 2)
-            side_dx /= side_length
-            side_dy /= side_length
+            # Corner offsets of a block on this side: its width runs along the
+            # normal and its height along the side. Polygon fills include their
+            # edges, so the extents are one pixel short of the block size
+            half_w = (BLOCK_WIDTH - 1) / 2
+            half_h = (BLOCK_HEIGHT - 1) / 2
+            half_wx, half_wy = normal[0] * half_w, normal[1] * half_w
+            half_hx, half_hy = side_dx * half_h, side_dy * half_h
+            corner_offsets = (
+                (-half_wx - half_hx, -half_wy - half_hy),
+                (half_wx - half_hx, half_wy - half_hy),
+                (half_wx + half_hx, half_wy + half_hy),
+                (-half_wx + half_hx, -half_wy + half_hy),
+            )
 
             for i, block in enumerate(blocks):
                 # Position block along the side
                 offset_distance = (i - len(blocks) / 2) * (BLOCK_WIDTH + 4)
 
                 # Calculate block position
-                base_x = (x1 + x2) / 2 + side_dx * offset_distance
-                base_y = (y1 + y2) / 2 + side_dy * offset_distance
+                base_x = center_x + side_dx * offset_distance
+                base_y = center_y + side_dy * offset_distance
 
                 # Move outward from hexagon
                 stack_offset = (i + 1) * (BLOCK_HEIGHT + 2)
@@ -164,59 +207,48 @@ class Game:
                 block_y = base_y + normal[1] * (HEXAGON_RADIUS / 2 + stack_offset)
 
                 # Draw block (as a rectangle rotated to align with side)
-                block_surf = pygame.Surface((BLOCK_WIDTH, BLOCK_HEIGHT))
-                block_surf.fill(block.color)
-                block_surf.set_colorkey((0, 0, 0))
-
-                # Rotate block to align with side
-                angle = math.degrees(math.atan2(-normal[1], normal[0]))
-                rotated_surf = pygame.transform.rotate(block_surf, angle)
-
-                rect = rotated_surf.get_rect(center=(block_x, block_y))
-                self.screen.blit(rotated_surf, rect)
+                corners = [(block_x + dx, block_y + dy) for dx, dy in corner_offsets]
+                pygame.draw.polygon(self.screen, block.color, corners)
 
     def draw_falling_bars(self):
         """Draw falling bars approaching the hexagon."""
+        blits = []
+        # Block positions along each side are shared by all bars on that side
+        side_bases = {}
         for bar in self.falling_bars:
+            bases = side_bases.get(bar.side_index)
+            if bases is None:
+                center_x, center_y = self.hexagon.get_side_center(bar.side_index)
+                side_dx, side_dy = self.hexagon.get_side_direction(bar.side_index)
+                bases = side_bases[bar.side_index] = [
+                    (center_x + side_dx * offset_distance, center_y + side_dy * offset_distance)
+                    for offset_distance in bar.offsets
+                ]
+
+            # Move outward by current distance
             normal = self.hexagon.get_side_normal(bar.side_index)
-            (x1, y1), (x2, y2) = self.hexagon.get_side_vertices(bar.side_index)
-
-            # Calculate side direction vector
-            side_dx = x2 - x1
-            side_dy = y2 - y1
-            side_length = math.sqrt(side_dx ** 2 + side_dy ** 2)
-            side_dx /= side_length
-            side_dy /= side_length
-
-            color = BLOCK_COLORS[bar.color_index]
-
-            for block_data in bar.blocks:
-                # Position along the side
-                offset_distance = block_data['offset']
-
-                # Calculate position at current distance
-                base_x = (x1 + x2) / 2 + side_dx * offset_distance
-                base_y = (y1 + y2) / 2 + side_dy * offset_distance
+            out_x = normal[0] * bar.distance
+            out_y = normal[1] * bar.distance
 
-                # Move outward by current distance
-                block_x = base_x + normal[0] * bar.distance
-                block_y = base_y + normal[1] * bar.distance
-
-                # Draw block
+            tile = self.block_tiles[bar.color_index]
+            for base_x, base_y in bases:
                 block_rect = pygame.Rect(
-                    block_x - block_data['width'] / 2,
-                    block_y - block_data['height'] / 2,
-                    block_data['width'],
-                    block_data['height']
+                    base_x + out_x - bar.width / 2,
+                    base_y + out_y - bar.height / 2,
+                    bar.width,
+                    bar.height
                 )
-                pygame.draw.rect(self.screen, color, block_rect)
+                blits.append((tile, block_rect))
+
+        # All falling blocks go out in one batched blit
+        self.screen.blits(blits, doreturn=False)
 
-    def draw_limit_line(self):
+    def draw_limit_line(self, surface):
         """Draw the limit line indicator."""
         # Draw a faint circle indicating the danger zone
         limit_radius = HEXAGON_RADIUS + MAX_STACK_HEIGHT * (BLOCK_HEIGHT + 4)
         pygame.draw.circle(
-            self.screen,
+            surface,
             COLOR_LIMIT_LINE,
             (self.center_x, self.center_y),
             limit_radius,
@@ -226,37 +258,32 @@ class Game:
     def draw_ui(self):
         """Draw user interface elements."""
         # Score
-        score_text = self.font_medium.render(f"Score: {self.score}", True, COLOR_TEXT)
+        score_text = render_text(self.font_medium, f"Score: {self.score}", COLOR_TEXT)
         self.screen.blit(score_text, (10, 10))
 
-        # Speed indicator
-        speed_text = self.font_small.render(
-            f"Speed: {self.fall_speed:.1f}x",
-            True,
-            COLOR_TEXT
-        )
-        self.screen.blit(speed_text, (10, 40))
+        # Speed indicator; round(x, 1) changes exactly when the .1f text does
+        speed_key = round(self.fall_speed, 1)
+        if speed_key != self._speed_surf_cache[0]:
+            self._speed_surf_cache = (
+                speed_key, render_text(self.font_small, f"Speed: {self.fall_speed:.1f}x", COLOR_TEXT))
+        self.screen.blit(self._speed_surf_cache[1], (10, 40))
 
         # Stack height indicator
         max_height = self.hexagon.get_max_stack_height()
-        height_color = COLOR_TEXT if max_height < MAX_STACK_HEIGHT * 0.7 else COLOR_LIMIT_LINE
-        height_text = self.font_small.render(
-            f"Stack: {max_height}/{MAX_STACK_HEIGHT}",
-            True,
-            height_color
-        )
-        self.screen.blit(height_text, (10, 60))
+        if max_height != self._height_surf_cache[0]:
+            height_color = COLOR_TEXT if max_height < MAX_STACK_HEIGHT * 0.7 else COLOR_LIMIT_LINE
+            self._height_surf_cache = (
+                max_height,
+                render_text(self.font_small, f"Stack: {max_height}/{MAX_STACK_HEIGHT}", height_color))
+        self.screen.blit(self._height_surf_cache[1], (10, 60))
 
     def draw_game_over(self):
         """Draw game over screen."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.game_over_overlay, (0, 0))
 
-        game_over_text = self.font_large.render("GAME OVER", True, COLOR_GAME_OVER)
-        score_text = self.font_medium.render(f"Final Score: {self.score}", True, COLOR_TEXT)
-        restart_text = self.font_small.render("Press R to restart or Q to quit", True, COLOR_TEXT)
+        game_over_text = render_text(self.font_large, "GAME OVER", COLOR_GAME_OVER)
+        score_text = render_text(self.font_medium, f"Final Score: {self.score}", COLOR_TEXT)
+        restart_text = render_text(self.font_small, "Press R to restart or Q to quit", COLOR_TEXT)
 
         game_over_rect = game_over_text.get_rect(center=(self.center_x, self.center_y - 50))
         score_rect = score_text.get_rect(center=(self.center_x, self.center_y + 10))
@@ -268,16 +295,14 @@ class Game:
 
     def render(self):
         """Render the game."""
-        self.screen.fill(COLOR_BG)
+        # The static layers are drawn in one blit of a cached backdrop
+        self.screen.blit(self.get_backdrop(not self.game_over), (0, 0))
 
         if not self.game_over:
-            self.draw_limit_line()
-            self.draw_hexagon()
             self.draw_stacked_blocks()
             self.draw_falling_bars()
             self.draw_ui()
         else:
-            self.draw_hexagon()
             self.draw_stacked_blocks()
             self.draw_game_over()
 
@@ -289,7 +314,10 @@ class Game:
         while running:
             running = self.handle_input()
             self.update()
-            self.render()
+            # The game-over screen is static, so it is only drawn once
+            if self._dirty:
+                self.render()
+                self._dirty = False
             self.clock.tick(FPS)
 
         pygame.quit()
@@ -1,8 +1,9 @@
+import functools
 import pygame
 import random
 import sys
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import List, Set, Tuple, Optional
 
 # Screen dimensions
 SCREEN_WIDTH = 600
@@ -18,6 +19,8 @@ COLOR_GRID = (50, 50, 70)
 COLOR_CELL_EMPTY = (40, 40, 60)
 COLOR_TEXT = (220, 220, 220)
 COLOR_HIGHLIGHT = (255, 255, 100)
+COLOR_CELL_SELECTED = (70, 70, 100)
+COLOR_CELL_TARGET = (80, 60, 60)
 
 # Symbol colors
 SYMBOL_COLORS = [
@@ -34,6 +37,22 @@ SHAPE_CIRCLE = 0
 SHAPE_SQUARE = 1
 SHAPE_TRIANGLE = 2
 SHAPE_DIAMOND = 3
+SHAPES = (SHAPE_CIRCLE, SHAPE_SQUARE, SHAPE_TRIANGLE, SHAPE_DIAMOND)
+SYMBOL_SIZE = 25
+
+# Menu instructions
+MENU_INSTRUCTIONS = [
+    "Memorize the highlighted pattern,",
+    "then recreate it by clicking cells.",
+    "",
+    "Press SPACE or CLICK to start"
+]
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface for repeated strings."""
+    return font.render(text, True, color)
 
 
 @dataclass
@@ -53,9 +72,28 @@ class PatternMatchGame:
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 28)
 
+        # The menu instructions never change, so they are laid out once
+        self.menu_text_surfaces = []
+        y = 300
+        for line in MENU_INSTRUCTIONS:
+            text = render_text(self.font_small, line, COLOR_TEXT)
+            self.menu_text_surfaces.append((text, text.get_rect(center=(SCREEN_WIDTH // 2, y))))
+            y += 35
+
+        self.cell_rects = [
+            [pygame.Rect(GRID_OFFSET_X + col * CELL_SIZE, GRID_OFFSET_Y + row * CELL_SIZE,
+                         CELL_SIZE - 4, CELL_SIZE - 4)
+             for col in range(GRID_SIZE)]
+            for row in range(GRID_SIZE)
+        ]
+        self.render_tiles()
+
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.game_over_overlay.fill((0, 0, 0, 180))
+
         self.grid: List[List[Optional[Cell]]] = []
         self.target_pattern: List[Tuple[int, int]] = []
-        self.selected_cells: List[Tuple[int, int]] = []
+        self.selected_cells: Set[Tuple[int, int]] = set()
         self.score = 0
         self.level = 1
         self.lives = 3
@@ -75,31 +113,44 @@ class PatternMatchGame:
 
     def generate_grid(self):
         """Generate the grid with colored symbols."""
-        self.grid = []
-        for r in range(GRID_SIZE):
-            row = []
-            for c in range(GRID_SIZE):
-                color_idx = random.randint(0, len(SYMBOL_COLORS) - 1)
-                shape = random.choice([SHAPE_CIRCLE, SHAPE_SQUARE, SHAPE_TRIANGLE, SHAPE_DIAMOND])
-                row.append(Cell(color_idx, shape, False))
-            self.grid.append(row)
+        # Draw every cell's color and shape in one call each
+        cell_count = GRID_SIZE * GRID_SIZE
+        colors = random.choices(range(len(SYMBOL_COLORS)), k=cell_count)
+        shapes = random.choices(SHAPES, k=cell_count)
+        self.grid = [
+            [Cell(colors[r * GRID_SIZE + c], shapes[r * GRID_SIZE + c], False) for c in range(GRID_SIZE)]
+            for r in range(GRID_SIZE)
+        ]
 
     def start_level(self):
         """Initialize a new level."""
         self.generate_grid()
         self.target_pattern = self.generate_pattern()
         self.target_cells_for_pattern = set(self.target_pattern)
-        self.selected_cells = []
+        self.selected_cells = set()
         self.pattern_timer = self.show_duration
         self.game_state = "showing_pattern"
 
-    def get_cell_rect(self, row: int, col: int) -> pygame.Rect:
-        """Get the rectangle for a grid cell."""
-        x = GRID_OFFSET_X + col * CELL_SIZE
-        y = GRID_OFFSET_Y + row * CELL_SIZE
-        return pygame.Rect(x, y, CELL_SIZE - 4, CELL_SIZE - 4)
-
-    def draw_symbol(self, surface, shape, color_idx, center_x, center_y, size=25):
+    def render_tiles(self):
+        """Pre-render every cell background and symbol so draw_grid only blits."""
+        cell_size = CELL_SIZE - 4
+        self.cell_bg_surfaces = {}
+        for bg_color in (COLOR_CELL_EMPTY, COLOR_CELL_SELECTED, COLOR_CELL_TARGET):
+            surface = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+            rect = surface.get_rect()
+            pygame.draw.rect(surface, bg_color, rect, border_radius=8)
+            pygame.draw.rect(surface, COLOR_GRID, rect, 2, border_radius=8)
+            self.cell_bg_surfaces[bg_color] = surface.convert_alpha()
+
+        tile_size = SYMBOL_SIZE * 2 + 1
+        self.symbol_surfaces = {}
+        for shape in SHAPES:
+            for color_idx in range(len(SYMBOL_COLORS)):
+                surface = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+                self.draw_symbol(surface, shape, color_idx, SYMBOL_SIZE, SYMBOL_SIZE)
+                self.symbol_surfaces[(shape, color_idx)] = surface.convert_alpha()
+
+    def draw_symbol(self, surface, shape, color_idx, center_x, center_y, size=SYMBOL_SIZE):
         """Draw a symbol at the given position."""
         color = SYMBOL_COLORS[color_idx]
         if shape == SHAPE_CIRCLE:
@@ -127,41 +178,40 @@ class PatternMatchGame:
         """Draw the game grid."""
         for r in range(GRID_SIZE):
             for c in range(GRID_SIZE):
-                rect = self.get_cell_rect(r, c)
+                rect = self.cell_rects[r][c]
                 cell = self.grid[r][c]
 
                 # Draw cell background
                 bg_color = COLOR_CELL_EMPTY
                 if (r, c) in self.selected_cells:
-                    bg_color = (70, 70, 100)
+                    bg_color = COLOR_CELL_SELECTED
                 elif (r, c) in self.target_cells_for_pattern and self.game_state == "showing_pattern":
-                    bg_color = (80, 60, 60)
+                    bg_color = COLOR_CELL_TARGET
 
-                pygame.draw.rect(self.screen, bg_color, rect, border_radius=8)
-                pygame.draw.rect(self.screen, COLOR_GRID, rect, 2, border_radius=8)
+                self.screen.blit(self.cell_bg_surfaces[bg_color], rect)
 
                 # Draw symbol
-                self.draw_symbol(self.screen, cell.shape, cell.color_idx,
-                               rect.centerx, rect.centery)
+                self.screen.blit(self.symbol_surfaces[(cell.shape, cell.color_idx)],
+                                 (rect.centerx - SYMBOL_SIZE, rect.centery - SYMBOL_SIZE))
 
     def draw_ui(self):
         """Draw the user interface."""
         # Score
-        score_text = self.font_medium.render(f"Score: {self.score}", True, COLOR_TEXT)
+        score_text = render_text(self.font_medium, f"Score: {self.score}", COLOR_TEXT)
         self.screen.blit(score_text, (20, 20))
 
         # Level
-        level_text = self.font_medium.render(f"Level: {self.level}", True, COLOR_TEXT)
+        level_text = render_text(self.font_medium, f"Level: {self.level}", COLOR_TEXT)
         self.screen.blit(level_text, (SCREEN_WIDTH - 150, 20))
 
         # Lives
-        lives_text = self.font_medium.render(f"Lives: {self.lives}", True, COLOR_TEXT)
+        lives_text = render_text(self.font_medium, f"Lives: {self.lives}", COLOR_TEXT)
         self.screen.blit(lives_text, (SCREEN_WIDTH // 2 - 50, 20))
 
         # Message
         if self.message_timer > 0:
             msg_color = COLOR_HIGHLIGHT if "Correct" in self.message else (255, 100, 100)
-            msg_text = self.font_medium.render(self.message, True, msg_color)
+            msg_text = render_text(self.font_medium, self.message, msg_color)
             rect = msg_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
             self.screen.blit(msg_text, rect)
 
@@ -169,47 +219,34 @@ class PatternMatchGame:
         """Draw the main menu."""
         self.screen.fill(COLOR_BG)
 
-        title = self.font_large.render("PATTERN MATCH", True, COLOR_HIGHLIGHT)
+        title = render_text(self.font_large, "PATTERN MATCH", COLOR_HIGHLIGHT)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(title, title_rect)
 
-        instructions = [
-            "Memorize the highlighted pattern,",
-            "then recreate it by clicking cells.",
-            "",
-            "Press SPACE or CLICK to start"
-        ]
-
-        y = 300
-        for line in instructions:
-            text = self.font_small.render(line, True, COLOR_TEXT)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
+        for text, text_rect in self.menu_text_surfaces:
             self.screen.blit(text, text_rect)
-            y += 35
 
-        high_score = self.font_small.render(f"High Score: {self.score}", True, (150, 150, 150))
+        high_score = render_text(self.font_small, f"High Score: {self.score}", (150, 150, 150))
         high_score_rect = high_score.get_rect(center=(SCREEN_WIDTH // 2, 500))
         self.screen.blit(high_score, high_score_rect)
 
     def draw_game_over(self):
         """Draw the game over screen."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.game_over_overlay, (0, 0))
 
-        game_over_text = self.font_large.render("GAME OVER", True, (255, 100, 100))
+        game_over_text = render_text(self.font_large, "GAME OVER", (255, 100, 100))
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, 250))
         self.screen.blit(game_over_text, game_over_rect)
 
-        final_score = self.font_medium.render(f"Final Score: {self.score}", True, COLOR_TEXT)
+        final_score = render_text(self.font_medium, f"Final Score: {self.score}", COLOR_TEXT)
         score_rect = final_score.get_rect(center=(SCREEN_WIDTH // 2, 320))
         self.screen.blit(final_score, score_rect)
 
-        level_reached = self.font_medium.render(f"Level Reached: {self.level}", True, COLOR_TEXT)
+        level_reached = render_text(self.font_medium, f"Level Reached: {self.level}", COLOR_TEXT)
         level_rect = level_reached.get_rect(center=(SCREEN_WIDTH // 2, 370))
         self.screen.blit(level_reached, level_rect)
 
-        restart_text = self.font_small.render("Press SPACE or CLICK to restart", True, COLOR_HIGHLIGHT)
+        restart_text = render_text(self.font_small, "Press SPACE or CLICK to restart", COLOR_HIGHLIGHT)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, 450))
         self.screen.blit(restart_text, restart_rect)
 
@@ -220,21 +257,19 @@ class PatternMatchGame:
 
         for r in range(GRID_SIZE):
             for c in range(GRID_SIZE):
-                rect = self.get_cell_rect(r, c)
+                rect = self.cell_rects[r][c]
                 if rect.collidepoint(pos):
                     if (r, c) in self.selected_cells:
                         self.selected_cells.remove((r, c))
                     else:
-                        self.selected_cells.append((r, c))
+                        self.selected_cells.add((r, c))
                     self.check_pattern()
                     break
 
     def check_pattern(self):
         """Check if the selected pattern matches the target."""
-        selected_set = set(self.selected_cells)
-
-        if len(selected_set) == len(self.target_pattern):
-            if selected_set == self.target_cells_for_pattern:
+        if len(self.selected_cells) == len(self.target_pattern):
+            if self.selected_cells == self.target_cells_for_pattern:
                 # Correct!
                 self.score += self.level * 100
                 self.level += 1
@@ -246,7 +281,7 @@ class PatternMatchGame:
                 self.lives -= 1
                 self.message = "Wrong pattern!"
                 self.message_timer = 60
-                self.selected_cells = []
+                self.selected_cells = set()
 
                 if self.lives <= 0:
                     self.game_state = "game_over"
@@ -305,9 +340,10 @@ class PatternMatchGame:
                 self.draw_ui()
 
                 if self.game_state == "showing_pattern":
-                    timer_text = self.font_medium.render(
+                    timer_text = render_text(
+                        self.font_medium,
                         f"Memorize! {self.pattern_timer // 60 + 1}",
-                        True, COLOR_HIGHLIGHT
+                        COLOR_HIGHLIGHT
                     )
                     timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
                     self.screen.blit(timer_text, timer_rect)
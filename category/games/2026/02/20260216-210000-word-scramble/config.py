@@ -24,7 +24,7 @@ TIME_PENALTY_PER_HINT = 20
 TIME_PENALTY_PER_WRONG = 10
 
 # Word list (scrambled words with their solutions)
-WORDS = [
+WORDS = (
     ("ELPPA", "APPLE"),
     ("ELBANAC", "BANANA"),
     ("ERP", "PEAR"),
@@ -75,7 +75,11 @@ WORDS = [
     ("ETY", "YET"),
     ("TEY", "YET"),
     ("YET", "YET"),
-]
+)
+
+# Letter tile size and gap between tiles in pixels
+TILE_SIZE = 60
+TILE_SPACING = 10
 
 # Font sizes
 FONT_SIZE_LARGE = 48
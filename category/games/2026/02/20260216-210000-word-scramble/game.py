@@ -3,14 +3,55 @@ Word Scramble - Game Logic
 Unscramble letters to form words.
 """
 
+import functools
 import random
+import string
 import pygame
 import sys
 from config import *
 
 
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface for repeated strings."""
+    return font.render(text, True, color).convert_alpha()
+
+
+_choice = random.choice
+
+# Word list split into parallel arrays indexed by word: the scrambled letters,
+# every accepted solution (fed to the per-word tries below) and the spelling
+# hints follow (the first solution listed)
+_SCRAMBLED = [scrambled for scrambled, _ in WORDS]
+_SOLUTIONS = [s if isinstance(s, tuple) else (s,) for _, s in WORDS]
+_SOLUTION_HINTS = [s[0] if isinstance(s, tuple) else s for _, s in WORDS]
+
+def build_trie(words):
+    """Build a letter trie of the given words; '$' marks the end of a word."""
+    trie = {}
+    for word in words:
+        node = trie
+        for c in word:
+            node = node.setdefault(c, {})
+        node['$'] = True
+    return trie
+
+
+# Word indices by the longest scrambled word allowed: level N draws words
+# of up to 3 + N letters, so early levels stay short
+_MIN_LEN = min(len(w) for w in _SCRAMBLED)
+_MAX_LEN = max(len(w) for w in _SCRAMBLED)
+_UP_TO_LEN = {
+    n: tuple(i for i, w in enumerate(_SCRAMBLED) if len(w) <= n)
+    for n in range(_MIN_LEN, _MAX_LEN + 1)
+}
+
+# One trie per word, so the input can be validated a letter at a time
+_TRIES = [build_trie(solutions) for solutions in _SOLUTIONS]
+
+
 class LetterTile:
-    def __init__(self, char, x, y, size=60):
+    def __init__(self, char, x, y, size=TILE_SIZE):
         self.char = char
         self.x = x
         self.y = y
@@ -19,34 +60,92 @@ class LetterTile:
         self.target_y = y
         self.selected = False
         self.used = False
+        self.settled = True
         self.rect = pygame.Rect(x, y, size, size)
 
+    def move_to(self, x, y):
+        self.target_x = x
+        self.target_y = y
+        self.settled = False
+
     def update(self):
-        self.x += (self.target_x - self.x) * 0.2
-        self.y += (self.target_y - self.y) * 0.2
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
+        if dx * dx + dy * dy < 0.25:
+            # Close enough: snap onto the target and stop easing
+            self.x, self.y = self.target_x, self.target_y
+            self.rect.topleft = (int(self.x), int(self.y))
+            self.settled = True
+            return
+        self.x += dx * 0.2
+        self.y += dy * 0.2
         self.rect.topleft = (int(self.x), int(self.y))
 
-    def draw(self, surface, font):
-        color = COLOR_LETTER_SELECTED if self.selected else COLOR_LETTER
+    def get_blits(self, tile_bgs, glyphs):
+        """Return the (surface, rect) pairs that draw this tile."""
+        state = "selected" if self.selected else "normal"
         if self.used:
-            color = COLOR_HINT
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, COLOR_ACCENT, self.rect, 3, border_radius=8)
-
-        text = font.render(self.char, True, COLOR_TEXT)
-        text_rect = text.get_rect(center=self.rect.center)
-        surface.blit(text, text_rect)
+            state = "used"
+        text = glyphs[self.char]
+        return (
+            (tile_bgs[state], self.rect.copy()),
+            (text, text.get_rect(center=self.rect.center)),
+        )
 
 
 class WordScrambleGame:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Word Scramble")
+        # Drop unhandled events (mouse motion, etc.) before they reach the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.VIDEOEXPOSE])
         self.clock = pygame.time.Clock()
         self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
         self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
         self.font_small = pygame.font.Font(None, FONT_SIZE_SMALL)
 
+        # Static strings are rendered once and only blitted each frame
+        self.title_surf = self.font_large.render("WORD SCRAMBLE", True, COLOR_ACCENT).convert_alpha()
+        self.title_rect = self.title_surf.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        self.inst1_surf = self.font_small.render("Click letters to form a word", True, COLOR_HINT).convert_alpha()
+        self.inst1_rect = self.inst1_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
+        self.inst2_surf = self.font_small.render(
+            "ENTER: Submit | BACKSPACE: Undo | H: Hint | SPACE: Reset", True, COLOR_HINT).convert_alpha()
+        self.inst2_rect = self.inst2_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 70))
+        self.game_over_surf = self.font_large.render("GAME OVER", True, COLOR_WRONG).convert_alpha()
+        self.game_over_rect = self.game_over_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+        self.restart_surf = self.font_small.render("Press R to restart or ESC to quit", True, COLOR_TEXT).convert_alpha()
+        self.restart_rect = self.restart_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70))
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.game_over_overlay.fill((0, 0, 0, 200))
+        self.game_over_overlay = self.game_over_overlay.convert_alpha()
+        # Anchors for text whose width varies
+        self.msg_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 130)
+        self.final_score_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
+
+        # Every tile letter is rasterized once up front
+        self.glyph_cache = {
+            c: self.font_large.render(c, True, COLOR_TEXT).convert_alpha()
+            for c in string.ascii_uppercase
+        }
+
+        # Rounded tile backgrounds, one per tile state
+        self.tile_bgs = {}
+        for state, color in (("normal", COLOR_LETTER), ("selected", COLOR_LETTER_SELECTED), ("used", COLOR_HINT)):
+            tile_bg = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            pygame.draw.rect(tile_bg, color, tile_bg.get_rect(), border_radius=8)
+            pygame.draw.rect(tile_bg, COLOR_ACCENT, tile_bg.get_rect(), 3, border_radius=8)
+            self.tile_bgs[state] = tile_bg.convert_alpha()
+
+        # Background, title and input box never change, so they are baked into one surface
+        self.input_bg = pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 130, 400, 50)
+        self.bg_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.bg_surface.fill(COLOR_BG)
+        self.input_text_center = self.input_bg.center
+        self.bg_surface.blit(self.title_surf, self.title_rect)
+        pygame.draw.rect(self.bg_surface, COLOR_ACCENT, self.input_bg, border_radius=8)
+
         self.score = 0
         self.lives = 3
         self.level = 1
@@ -55,8 +154,7 @@ class WordScrambleGame:
 
         self.new_word()
         self.letter_tiles = []
-        self.selected_letters = []
-        self.user_input = ""
+        self.clear_input()
 
         self.message = ""
         self.message_timer = 0
@@ -65,20 +163,26 @@ class WordScrambleGame:
         self.game_over = False
         self.victory = False
 
+        # Rendered HUD, input and message text, kept until the value they show changes
+        self._hud_blits = {}
+        self._input_blit = (None, None)
+        self._msg_blit = (None, None)
+        self._final_score_blit = (None, None)
+
+        # What was on screen after the last draw; None forces a full repaint
+        self._drawn = None
+
     def new_word(self):
-        self.current_word_data = random.choice(WORDS)
-        if isinstance(self.current_word_data[1], tuple):
-            self.scrambled = self.current_word_data[0]
-            self.solutions = self.current_word_data[1]
-        else:
-            self.scrambled = self.current_word_data[0]
-            self.solutions = self.current_word_data[1]
+        idx = _choice(_UP_TO_LEN[max(_MIN_LEN, min(3 + self.level, _MAX_LEN))])
+        self.scrambled = _SCRAMBLED[idx]
+        self.solution_hint = _SOLUTION_HINTS[idx]
+        self.trie = _TRIES[idx]
         self.letters = list(self.scrambled)
 
     def create_letter_tiles(self):
         self.letter_tiles = []
-        tile_size = 60
-        spacing = 10
+        tile_size = TILE_SIZE
+        spacing = TILE_SPACING
         total_width = len(self.letters) * (tile_size + spacing) - spacing
         start_x = (SCREEN_WIDTH - total_width) // 2
         start_y = SCREEN_HEIGHT // 2 - 50
@@ -87,16 +191,34 @@ class WordScrambleGame:
             x = start_x + i * (tile_size + spacing)
             self.letter_tiles.append(LetterTile(char, x, start_y, tile_size))
 
-    def check_answer(self, answer):
-        if isinstance(self.solutions, tuple):
-            return answer in self.solutions
-        return answer == self.solutions
+        # Row layout of the clickable tiles, used for hit testing
+        self.unused_tiles = list(self.letter_tiles)
+        self.unused_start_x = start_x
+        self.unused_row_y = start_y
+
+    def clear_input(self):
+        self.selected_letters = []
+        self.user_input = ""
+        # Trie nodes for each prefix of the input; None once no solution fits
+        self.trie_path = [self.trie]
+
+    def is_valid_prefix(self):
+        return self.trie_path[-1] is not None
+
+    def select_tile(self, tile):
+        tile.used = True
+        self.selected_letters.append(tile)
+        self.user_input += tile.char
+        node = self.trie_path[-1]
+        self.trie_path.append(node.get(tile.char) if node is not None else None)
+        self.arrange_letters()
 
     def submit_answer(self):
         if not self.user_input:
             return
 
-        if self.check_answer(self.user_input):
+        node = self.trie_path[-1]
+        if node is not None and '$' in node:
             self.score += len(self.user_input) * POINTS_PER_LETTER + BONUS_POINTS
             self.words_solved += 1
             self.show_message("Correct!", COLOR_CORRECT)
@@ -108,8 +230,7 @@ class WordScrambleGame:
 
             self.new_word()
             self.create_letter_tiles()
-            self.selected_letters = []
-            self.user_input = ""
+            self.clear_input()
         else:
             self.lives -= 1
             self.score -= TIME_PENALTY_PER_WRONG
@@ -125,19 +246,16 @@ class WordScrambleGame:
         self.hints_remaining -= 1
         self.score -= TIME_PENALTY_PER_HINT
 
-        if isinstance(self.solutions, tuple):
-            solution = self.solutions[0]
-        else:
-            solution = self.solutions
+        position = len(self.selected_letters)
+        if position >= len(self.solution_hint):
+            return
 
-        for i, tile in enumerate(self.letter_tiles):
+        next_char = self.solution_hint[position]
+        for tile in self.letter_tiles:
             if tile.used:
                 continue
-            if tile.char == solution[len(self.selected_letters)]:
-                tile.used = True
-                self.selected_letters.append(tile)
-                self.user_input += tile.char
-                self.arrange_letters()
+            if tile.char == next_char:
+                self.select_tile(tile)
                 break
 
     def show_message(self, message, color):
@@ -146,40 +264,53 @@ class WordScrambleGame:
         self.message_timer = 60
 
     def arrange_letters(self):
-        tile_size = 60
-        spacing = 10
+        tile_size = TILE_SIZE
+        spacing = TILE_SPACING
+        step = tile_size + spacing
 
-        # Arrange unused tiles in bottom row
-        unused_tiles = [t for t in self.letter_tiles if not t.used]
-        total_width = len(unused_tiles) * (tile_size + spacing) - spacing
-        start_x = (SCREEN_WIDTH - total_width) // 2 if unused_tiles else SCREEN_WIDTH // 2
-        start_y = SCREEN_HEIGHT // 2 - 50
+        n_used = sum(1 for t in self.letter_tiles if t.used)
+        n_unused = len(self.letter_tiles) - n_used
 
-        for i, tile in enumerate(unused_tiles):
-            tile.target_x = start_x + i * (tile_size + spacing)
-            tile.target_y = start_y
+        # Unused tiles go in the bottom row, used tiles in the top row
+        start_x_unused = (SCREEN_WIDTH - (n_unused * step - spacing)) // 2 if n_unused else SCREEN_WIDTH // 2
+        start_x_used = (SCREEN_WIDTH - (n_used * step - spacing)) // 2 if n_used else SCREEN_WIDTH // 2
+        y_unused = SCREEN_HEIGHT // 2 - 50
+        y_used = SCREEN_HEIGHT // 2 + 100
 
-        # Arrange used tiles in top row
-        used_tiles = [t for t in self.letter_tiles if t.used]
-        total_width = len(used_tiles) * (tile_size + spacing) - spacing
-        start_x = (SCREEN_WIDTH - total_width) // 2 if used_tiles else SCREEN_WIDTH // 2
-        start_y = SCREEN_HEIGHT // 2 + 100
+        i_unused = i_used = 0
+        unused_tiles = []
+        for tile in self.letter_tiles:
+            if tile.used:
+                tile.move_to(start_x_used + i_used * step, y_used)
+                i_used += 1
+            else:
+                tile.move_to(start_x_unused + i_unused * step, y_unused)
+                unused_tiles.append(tile)
+                i_unused += 1
 
-        for i, tile in enumerate(used_tiles):
-            tile.target_x = start_x + i * (tile_size + spacing)
-            tile.target_y = start_y
+        self.unused_tiles = unused_tiles
+        self.unused_start_x = start_x_unused
+        self.unused_row_y = y_unused
 
     def handle_letter_click(self, pos):
         if self.game_over:
             return
 
-        for tile in self.letter_tiles:
-            if tile.rect.collidepoint(pos) and not tile.used:
-                tile.used = True
-                self.selected_letters.append(tile)
-                self.user_input += tile.char
-                self.arrange_letters()
-                return
+        # Tiles still easing into place are off the row layout, so scan them
+        if any(not tile.settled for tile in self.letter_tiles):
+            for tile in self.letter_tiles:
+                if tile.rect.collidepoint(pos) and not tile.used:
+                    self.select_tile(tile)
+                    return
+            return
+
+        # Otherwise the row and column under the cursor give the tile directly
+        x, y = pos
+        if not self.unused_row_y <= y < self.unused_row_y + TILE_SIZE:
+            return
+        col, offset = divmod(x - self.unused_start_x, TILE_SIZE + TILE_SPACING)
+        if offset < TILE_SIZE and 0 <= col < len(self.unused_tiles):
+            self.select_tile(self.unused_tiles[col])
 
     def handle_backspace(self):
         if not self.selected_letters or self.game_over:
@@ -188,13 +319,13 @@ class WordScrambleGame:
         tile = self.selected_letters.pop()
         tile.used = False
         self.user_input = self.user_input[:-1]
+        self.trie_path.pop()
         self.arrange_letters()
 
     def reset_current_word(self):
         for tile in self.letter_tiles:
             tile.used = False
-        self.selected_letters = []
-        self.user_input = ""
+        self.clear_input()
         self.create_letter_tiles()
 
     def restart(self):
@@ -207,14 +338,16 @@ class WordScrambleGame:
         self.victory = False
         self.new_word()
         self.create_letter_tiles()
-        self.selected_letters = []
-        self.user_input = ""
+        self.clear_input()
 
     def handle_input(self, event):
         if event.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
 
+        if event.type == pygame.VIDEOEXPOSE:
+            self._drawn = None
+
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
                 self.handle_letter_click(event.pos)
@@ -245,75 +378,89 @@ class WordScrambleGame:
             self.message_timer -= 1
 
         for tile in self.letter_tiles:
-            tile.update()
-
-    def draw(self):
-        self.screen.fill(COLOR_BG)
-
-        # Draw title
-        title = self.font_large.render("WORD SCRAMBLE", True, COLOR_ACCENT)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        self.screen.blit(title, title_rect)
-
-        # Draw score and info
-        score_text = self.font_medium.render(f"Score: {self.score}", True, COLOR_TEXT)
-        self.screen.blit(score_text, (20, 20))
-
-        lives_text = self.font_medium.render(f"Lives: {self.lives}", True, COLOR_TEXT)
-        self.screen.blit(lives_text, (20, 60))
-
-        level_text = self.font_medium.render(f"Level: {self.level}", True, COLOR_TEXT)
-        self.screen.blit(level_text, (SCREEN_WIDTH - 150, 20))
-
-        hints_text = self.font_medium.render(f"Hints: {self.hints_remaining}", True, COLOR_TEXT)
-        self.screen.blit(hints_text, (SCREEN_WIDTH - 150, 60))
-
-        # Draw instructions
+            if not tile.settled:
+                tile.update()
+
+    def get_hud_blit(self, label, value, pos):
+        """Return the blit for a HUD line, re-rendered only when its value changes."""
+        cached = self._hud_blits.get(label)
+        if cached is None or cached[0] != value:
+            text = render_text(self.font_medium, label + str(value), COLOR_TEXT)
+            cached = self._hud_blits[label] = (value, (text, text.get_rect(topleft=pos)))
+        return cached[1]
+
+    def get_scene(self):
+        """Return the (surface, rect) pairs drawn over the background, in order."""
+        scene = []
+
+        # Score and info
+        scene.append(self.get_hud_blit("Score: ", self.score, (20, 20)))
+        scene.append(self.get_hud_blit("Lives: ", self.lives, (20, 60)))
+        scene.append(self.get_hud_blit("Level: ", self.level, (SCREEN_WIDTH - 150, 20)))
+        scene.append(self.get_hud_blit("Hints: ", self.hints_remaining, (SCREEN_WIDTH - 150, 60)))
+
+        # Instructions
         if not self.game_over:
-            inst1 = self.font_small.render("Click letters to form a word", True, COLOR_HINT)
-            inst1_rect = inst1.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
-            self.screen.blit(inst1, inst1_rect)
+            scene.append((self.inst1_surf, self.inst1_rect))
+            scene.append((self.inst2_surf, self.inst2_rect))
 
-            inst2 = self.font_small.render("ENTER: Submit | BACKSPACE: Undo | H: Hint | SPACE: Reset", True, COLOR_HINT)
-            inst2_rect = inst2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 70))
-            self.screen.blit(inst2, inst2_rect)
-
-        # Draw letter tiles
+        # Letter tiles
         for tile in self.letter_tiles:
-            tile.draw(self.screen, self.font_large)
-
-        # Draw current input
-        input_bg = pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 130, 400, 50)
-        pygame.draw.rect(self.screen, COLOR_ACCENT, input_bg, border_radius=8)
-        input_text = self.font_medium.render(self.user_input, True, COLOR_TEXT)
-        input_text_rect = input_text.get_rect(center=input_bg.center)
-        self.screen.blit(input_text, input_text_rect)
-
-        # Draw message
+            scene.extend(tile.get_blits(self.tile_bgs, self.glyph_cache))
+
+        # Current input
+        # A prefix that cannot lead to any solution is shown as wrong right away
+        input_key = (self.user_input, self.is_valid_prefix())
+        if input_key != self._input_blit[0]:
+            input_color = COLOR_TEXT if input_key[1] else COLOR_WRONG
+            input_text = render_text(self.font_medium, self.user_input, input_color)
+            self._input_blit = (input_key, (input_text, input_text.get_rect(center=self.input_text_center)))
+        scene.append(self._input_blit[1])
+
+        # Message
         if self.message_timer > 0:
-            msg_text = self.font_medium.render(self.message, True, self.message_color)
-            msg_rect = msg_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 130))
-            self.screen.blit(msg_text, msg_rect)
+            msg_key = (self.message, self.message_color)
+            if msg_key != self._msg_blit[0]:
+                msg_text = render_text(self.font_medium, self.message, self.message_color)
+                self._msg_blit = (msg_key, (msg_text, msg_text.get_rect(center=self.msg_center)))
+            scene.append(self._msg_blit[1])
 
-        # Draw game over screen
+        # Game over screen
         if self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 200))
-            self.screen.blit(overlay, (0, 0))
+            scene.append((self.game_over_overlay, self.game_over_overlay.get_rect()))
 
-            game_over_text = self.font_large.render("GAME OVER", True, COLOR_WRONG)
-            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            self.screen.blit(game_over_text, game_over_rect)
+            scene.append((self.game_over_surf, self.game_over_rect))
 
-            final_score_text = self.font_medium.render(f"Final Score: {self.score}", True, COLOR_TEXT)
-            final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-            self.screen.blit(final_score_text, final_score_rect)
+            if self.score != self._final_score_blit[0]:
+                final_score_text = render_text(self.font_medium, f"Final Score: {self.score}", COLOR_TEXT)
+                self._final_score_blit = (
+                    self.score, (final_score_text, final_score_text.get_rect(center=self.final_score_center)))
+            scene.append(self._final_score_blit[1])
+
+            scene.append((self.restart_surf, self.restart_rect))
+
+        return scene
+
+    def draw(self):
+        scene = self.get_scene()
+
+        # Anything added, moved or removed since the last frame needs repainting
+        drawn = {(surf, tuple(rect)) for surf, rect in scene}
+        if self._drawn is None:
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = [pygame.Rect(rect) for _, rect in drawn ^ self._drawn]
+        self._drawn = drawn
+        if not dirty:
+            return
 
-            restart_text = self.font_small.render("Press R to restart or ESC to quit", True, COLOR_TEXT)
-            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70))
-            self.screen.blit(restart_text, restart_rect)
+        # Repaint the whole stack inside the changed area only
+        self.screen.set_clip(dirty[0].unionall(dirty[1:]))
+        self.screen.blit(self.bg_surface, (0, 0))
+        self.screen.blits(scene, doreturn=False)
+        self.screen.set_clip(None)
 
-        pygame.display.flip()
+        pygame.display.update(dirty)
 
     def run(self):
         self.create_letter_tiles()
@@ -3,6 +3,7 @@ Vector Circus Charlie Tightrope Walk
 A circus tightrope balance and timing challenge.
 """
 
+import math
 import pygame
 import sys
 import random
@@ -13,6 +14,9 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 400
 FPS = 60
 ROPE_Y = 250
+# Pre-rendered rope strip: rows above the rope line, and total height
+ROPE_LAYER_TOP = 4
+ROPE_LAYER_HEIGHT = 12
 WORLD_WIDTH = 2000
 GOAL_X = 1900
 
@@ -39,6 +43,9 @@ PERFORMER_HEIGHT = 48
 MONKEY_WIDTH = 24
 MONKEY_HEIGHT = 24
 
+# Monkey tail sway per animation frame (15 degrees per frame)
+TAIL_SWAY = tuple(int(math.cos(math.radians(i * 15)) * 8) for i in range(15))
+
 # Scoring
 SCORE_PER_DISTANCE = 1
 SCORE_PER_MONKEY = 100
@@ -53,6 +60,9 @@ class GameState(Enum):
 
 
 class Performer:
+    __slots__ = ('x', 'y', 'vy', 'on_rope', 'width', 'height', 'moving', 'facing_right',
+                 'anim_frame', '_base_surf')
+
     def __init__(self):
         self.x = 50
         self.y = ROPE_Y
@@ -63,6 +73,7 @@ class Performer:
         self.moving = False
         self.facing_right = True
         self.anim_frame = 0
+        self._base_surf = self._render_base()
 
     def jump(self):
         if self.on_rope:
@@ -105,33 +116,44 @@ class Performer:
     def get_rect(self):
         return pygame.Rect(self.x, self.y - self.height, self.width, self.height)
 
-    def draw(self, surface, camera_x):
-        screen_x = self.x - camera_x
-        rect = pygame.Rect(screen_x, self.y - self.height, self.width, self.height)
-
-        # Simple vector art performer on tightrope
+    def _render_base(self):
+        """Render the pole, body, head and hat, which never change, once."""
+        # One extra column holds the pole's inclusive right end point
+        base = pygame.Surface((self.width + 61, self.height + 20), pygame.SRCALPHA)
+        # Local origin: the performer's left edge is at x=30, its top at y=10
+        left, top = 30, 10
 
         # Balance pole
-        pole_y = self.y - self.height + 15
+        pole_y = top + 15
         pole_length = 60
-        pygame.draw.line(surface, COLOR_PERFORMER_ACCENT,
-                        (screen_x - pole_length // 2, pole_y),
-                        (screen_x + self.width + pole_length // 2, pole_y), 3)
+        pygame.draw.line(base, COLOR_PERFORMER_ACCENT,
+                        (left - pole_length // 2, pole_y),
+                        (left + self.width + pole_length // 2, pole_y), 3)
 
         # Body
-        body_rect = pygame.Rect(screen_x + 8, self.y - self.height + 20, 16, 20)
-        pygame.draw.rect(surface, COLOR_PERFORMER, body_rect)
+        body_rect = pygame.Rect(left + 8, top + 20, 16, 20)
+        pygame.draw.rect(base, COLOR_PERFORMER, body_rect)
 
         # Head
-        head_center = (screen_x + 16, self.y - self.height + 10)
-        pygame.draw.circle(surface, COLOR_PERFORMER, head_center, 10)
+        head_center = (left + 16, top + 10)
+        pygame.draw.circle(base, COLOR_PERFORMER, head_center, 10)
 
         # Top hat
-        pygame.draw.rect(surface, COLOR_PERFORMER_ACCENT,
-                        (screen_x + 8, self.y - self.height - 5, 16, 8))
-        pygame.draw.line(surface, COLOR_PERFORMER_ACCENT,
-                        (screen_x + 6, self.y - self.height + 3),
-                        (screen_x + 26, self.y - self.height + 3), 2)
+        pygame.draw.rect(base, COLOR_PERFORMER_ACCENT,
+                        (left + 8, top - 5, 16, 8))
+        pygame.draw.line(base, COLOR_PERFORMER_ACCENT,
+                        (left + 6, top + 3),
+                        (left + 26, top + 3), 2)
+
+        return base.convert_alpha()
+
+    def draw(self, surface, camera_x):
+        screen_x = self.x - camera_x
+
+        # Simple vector art performer on tightrope
+
+        # Pole, body, head and hat
+        surface.blit(self._base_surf, (int(screen_x) - 30, int(self.y - self.height) - 10))
 
         # Arms
         arm_offset = 2 if self.on_rope else -5
@@ -158,6 +180,8 @@ class Performer:
 
 
 class Monkey:
+    __slots__ = ('x', 'y', 'speed', 'width', 'height', 'anim_frame', 'passed')
+
     def __init__(self, x, speed):
         self.x = x
         self.y = ROPE_Y - MONKEY_HEIGHT
@@ -165,6 +189,7 @@ class Monkey:
         self.width = MONKEY_WIDTH
         self.height = MONKEY_HEIGHT
         self.anim_frame = random.randint(0, 10)
+        self.passed = False
 
     def update(self):
         self.x -= self.speed
@@ -202,9 +227,7 @@ class Monkey:
         pygame.draw.circle(surface, COLOR_MONKEY, (screen_x + 22, self.y + 5), 4)
 
         # Tail
-        tail_sway = int(pygame.math.Vector2(
-            1, 0
-        ).rotate(self.anim_frame * 15).x * 8)
+        tail_sway = TAIL_SWAY[self.anim_frame]
         tail_end = (screen_x - 5 + tail_sway, body_y + 7)
         pygame.draw.lines(surface, COLOR_MONKEY, False,
                           [(screen_x + 4, body_y + 7), tail_end], 2)
@@ -215,11 +238,89 @@ class Game:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Vector Circus Charlie Tightrope Walk")
+        # Only key and quit events are handled; mouse events never reach the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
+        self.right_held = False
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 28)
+        self.rope_layers = [self.render_rope(phase) for phase in (0, 10)]
+        self.render_static_texts()
         self.reset()
 
+    def render_static_texts(self):
+        """Render the text that never changes once, as (surface, rect) blits."""
+        self.goal_text = self.small_font.render("GOAL", True, (255, 255, 255))
+
+        # Menu title
+        title = self.font.render("TIGHTROPE WALK", True, (255, 200, 50))
+        subtitle = self.small_font.render("CIRCUS CHARLIE", True, (200, 150, 50))
+        self.menu_texts = [
+            (title, title.get_rect(center=(SCREEN_WIDTH // 2, 100))),
+            (subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 140))),
+        ]
+
+        # Menu instructions
+        instructions = [
+            "PRESS SPACE TO START",
+            "",
+            "CONTROLS:",
+            "RIGHT ARROW - Move Forward",
+            "SPACEBAR - Jump",
+            "",
+            "Jump over incoming monkeys!",
+            "Reach the goal to win!",
+            "Don't fall off the rope!",
+        ]
+
+        y = 200
+        for line in instructions:
+            if line == "PRESS SPACE TO START":
+                color = (255, 255, 255)
+                font = self.font
+            elif line.startswith("CONTROLS"):
+                color = (255, 200, 50)
+                font = self.small_font
+            else:
+                color = (180, 180, 180)
+                font = self.small_font
+
+            text = font.render(line, True, color)
+            self.menu_texts.append((text, text.get_rect(center=(SCREEN_WIDTH // 2, y))))
+            y += 30
+
+        # Game over and victory titles with their restart prompts
+        game_over = self.font.render("GAME OVER", True, (255, 50, 50))
+        restart = self.small_font.render("PRESS SPACE TO RESTART", True, (255, 200, 50))
+        self.game_over_texts = [
+            (game_over, game_over.get_rect(center=(SCREEN_WIDTH // 2, 140))),
+            (restart, restart.get_rect(center=(SCREEN_WIDTH // 2, 280))),
+        ]
+
+        victory = self.font.render("VICTORY!", True, (50, 255, 50))
+        play_again = self.small_font.render("PRESS SPACE TO PLAY AGAIN", True, (255, 200, 50))
+        self.victory_texts = [
+            (victory, victory.get_rect(center=(SCREEN_WIDTH // 2, 140))),
+            (play_again, play_again.get_rect(center=(SCREEN_WIDTH // 2, 280))),
+        ]
+
+    def render_rope(self, shift):
+        """Render the rope with its texture dashes shifted by the given amount."""
+        layer = pygame.Surface((SCREEN_WIDTH, ROPE_LAYER_HEIGHT), pygame.SRCALPHA)
+        rope_y = ROPE_LAYER_TOP
+        pygame.draw.line(layer, COLOR_ROPE_SHADOW,
+                         (0, rope_y + 3), (SCREEN_WIDTH, rope_y + 3), 4)
+        pygame.draw.line(layer, COLOR_ROPE,
+                         (0, rope_y), (SCREEN_WIDTH, rope_y), 4)
+
+        for x in range(0, SCREEN_WIDTH, 10):
+            offset = (x + shift) % 20
+            if offset < 10:
+                pygame.draw.line(layer, COLOR_ROPE_SHADOW,
+                                (x, rope_y), (x + 5, rope_y), 2)
+        return layer.convert_alpha()
+
     def reset(self):
         self.performer = Performer()
         self.monkeys = []
@@ -229,6 +330,9 @@ class Game:
         self.monkeys_spawned = 0
         self.spawn_timer = 0
         self.bg_offset = 0
+        self._score_cache = (-1, None)
+        self._dist_cache = (-1, None)
+        self._final_score_cache = (-1, None)
 
     def spawn_monkey(self):
         # Spawn monkeys at varying speeds and positions
@@ -263,8 +367,6 @@ class Game:
         self.camera_x += (target_x - self.camera_x) * 0.1
 
     def handle_input(self):
-        keys = pygame.key.get_pressed()
-
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -277,12 +379,18 @@ class Game:
                         self.performer.jump()
                     elif self.state in [GameState.GAME_OVER, GameState.VICTORY]:
                         self.reset()
+                elif event.key == pygame.K_RIGHT:
+                    self.right_held = True
                 elif event.key == pygame.K_ESCAPE:
                     return False
 
+            elif event.type == pygame.KEYUP:
+                if event.key == pygame.K_RIGHT:
+                    self.right_held = False
+
         # Continuous input handling
         if self.state == GameState.PLAYING:
-            if keys[pygame.K_RIGHT]:
+            if self.right_held:
                 self.performer.move_right()
             else:
                 self.performer.stop_moving()
@@ -317,17 +425,21 @@ class Game:
                 self.spawn_monkey()
             self.spawn_timer = 0
 
-        # Update monkeys
+        # Update monkeys, scoring and dropping off-screen ones in the same pass
+        performer_x = self.performer.x
+        remaining_monkeys = []
         for monkey in self.monkeys:
             monkey.update()
 
             # Score for passing monkeys
-            if monkey.x + monkey.width < self.performer.x and not hasattr(monkey, 'passed'):
+            if not monkey.passed and monkey.x + monkey.width < performer_x:
                 monkey.passed = True
                 self.score += SCORE_PER_MONKEY
 
-        # Remove off-screen monkeys
-        self.monkeys = [m for m in self.monkeys if m.x > -50]
+            if monkey.x > -50:
+                remaining_monkeys.append(monkey)
+
+        self.monkeys = remaining_monkeys
 
         # Check collisions
         if self.check_collisions():
@@ -353,18 +465,9 @@ class Game:
                 (tent_x + 60, ROPE_Y + 50)
             ])
 
-        # Draw rope
-        pygame.draw.line(self.screen, COLOR_ROPE_SHADOW,
-                         (0, ROPE_Y + 3), (SCREEN_WIDTH, ROPE_Y + 3), 4)
-        pygame.draw.line(self.screen, COLOR_ROPE,
-                         (0, ROPE_Y), (SCREEN_WIDTH, ROPE_Y), 4)
-
-        # Draw rope texture
-        for x in range(0, SCREEN_WIDTH, 10):
-            offset = (x + int(self.bg_offset * 0.5)) % 20
-            if offset < 10:
-                pygame.draw.line(self.screen, COLOR_ROPE_SHADOW,
-                                (x, ROPE_Y), (x + 5, ROPE_Y), 2)
+        # Draw rope; its texture only ever shows one of two dash phases
+        phase = 1 if int(self.bg_offset * 0.5) % 20 >= 10 else 0
+        self.screen.blit(self.rope_layers[phase], (0, ROPE_Y - ROPE_LAYER_TOP))
 
         # Draw goal platform
         goal_screen_x = GOAL_X - self.camera_x
@@ -376,8 +479,7 @@ class Game:
                 (goal_screen_x + 30, ROPE_Y - 60),
                 (goal_screen_x + 50, ROPE_Y)
             ])
-            goal_text = self.small_font.render("GOAL", True, (255, 255, 255))
-            self.screen.blit(goal_text, (goal_screen_x + 20, ROPE_Y + 25))
+            self.screen.blit(self.goal_text, (goal_screen_x + 20, ROPE_Y + 25))
 
         # Draw progress bar
         bar_width = SCREEN_WIDTH - 40
@@ -393,97 +495,45 @@ class Game:
         pygame.draw.rect(self.screen, COLOR_HUD_BG, (10, 35, 150, 40), border_radius=5)
 
         # Score text
-        score_text = self.font.render(str(self.score), True, COLOR_TEXT)
-        self.screen.blit(score_text, (20, 40))
+        if self.score != self._score_cache[0]:
+            self._score_cache = (self.score, self.font.render(str(self.score), True, COLOR_TEXT))
+        self.screen.blit(self._score_cache[1], (20, 40))
 
         # Distance indicator
         distance = min(100, int(self.performer.x / GOAL_X * 100))
-        dist_text = self.small_font.render(f"DST: {distance}%", True, (150, 150, 150))
-        self.screen.blit(dist_text, (20, 75))
+        if distance != self._dist_cache[0]:
+            self._dist_cache = (distance, self.small_font.render(f"DST: {distance}%", True, (150, 150, 150)))
+        self.screen.blit(self._dist_cache[1], (20, 75))
 
     def draw_menu(self):
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        # Title
-        title = self.font.render("TIGHTROPE WALK", True, (255, 200, 50))
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
-
-        subtitle = self.small_font.render("CIRCUS CHARLIE", True, (200, 150, 50))
-        sub_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 140))
-        self.screen.blit(subtitle, sub_rect)
-
-        # Instructions
-        instructions = [
-            "PRESS SPACE TO START",
-            "",
-            "CONTROLS:",
-            "RIGHT ARROW - Move Forward",
-            "SPACEBAR - Jump",
-            "",
-            "Jump over incoming monkeys!",
-            "Reach the goal to win!",
-            "Don't fall off the rope!",
-        ]
-
-        y = 200
-        for line in instructions:
-            if line == "PRESS SPACE TO START":
-                color = (255, 255, 255)
-                font = self.font
-            elif line.startswith("CONTROLS"):
-                color = (255, 200, 50)
-                font = self.small_font
-            else:
-                color = (180, 180, 180)
-                font = self.small_font
-
-            text = font.render(line, True, color)
-            rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
-            self.screen.blit(text, rect)
-            y += 30
+        self.screen.blits(self.menu_texts, doreturn=False)
 
     def draw_game_over(self):
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        # Game over text
-        game_over = self.font.render("GAME OVER", True, (255, 50, 50))
-        go_rect = game_over.get_rect(center=(SCREEN_WIDTH // 2, 140))
-        self.screen.blit(game_over, go_rect)
-
-        # Final score
-        score_text = self.font.render(f"SCORE: {self.score}", True, (255, 255, 255))
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
-        self.screen.blit(score_text, score_rect)
-
-        # Restart prompt
-        restart = self.small_font.render("PRESS SPACE TO RESTART", True, (255, 200, 50))
-        restart_rect = restart.get_rect(center=(SCREEN_WIDTH // 2, 280))
-        self.screen.blit(restart, restart_rect)
+        self.screen.blits(self.game_over_texts, doreturn=False)
+        self.draw_final_score()
 
     def draw_victory(self):
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        # Victory text
-        victory = self.font.render("VICTORY!", True, (50, 255, 50))
-        v_rect = victory.get_rect(center=(SCREEN_WIDTH // 2, 140))
-        self.screen.blit(victory, v_rect)
-
-        # Final score
-        score_text = self.font.render(f"SCORE: {self.score}", True, (255, 255, 255))
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
-        self.screen.blit(score_text, score_rect)
-
-        # Restart prompt
-        restart = self.small_font.render("PRESS SPACE TO PLAY AGAIN", True, (255, 200, 50))
-        restart_rect = restart.get_rect(center=(SCREEN_WIDTH // 2, 280))
-        self.screen.blit(restart, restart_rect)
+        self.screen.blits(self.victory_texts, doreturn=False)
+        self.draw_final_score()
+
+    def draw_final_score(self):
+        if self.score != self._final_score_cache[0]:
+            score_text = self.font.render(f"SCORE: {self.score}", True, (255, 255, 255))
+            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
+            self._final_score_cache = (self.score, (score_text, score_rect))
+        self.screen.blit(*self._final_score_cache[1])
 
     def draw(self):
         self.draw_background()
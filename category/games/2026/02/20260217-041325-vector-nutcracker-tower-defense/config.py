@@ -26,6 +26,12 @@ ENEMY_PATH = [
     (12, 5), (13, 5), (14, 5), (15, 5)
 ]
 
+# Pixel centers of the enemy path cells
+PATH_WORLD = tuple(
+    (x * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_X, y * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_Y)
+    for x, y in ENEMY_PATH
+)
+
 # Enemy types
 ENEMY_TYPES = {
     "Standard": {"health": 50, "speed": 1.0, "reward": 15, "color": (200, 100, 100)},
@@ -1,12 +1,53 @@
 """Enemy class for tower defense game."""
 
+import math
 import pygame
 from config import *
 
 
+# Mouse sprites per enemy type, rendered on first use
+_SPRITE_CACHE = {}
+
+
+def _render_sprite(color):
+    """Render the wind-up mouse body, head and ears centered in a cell-sized surface."""
+    sprite = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+    center_x = center_y = CELL_SIZE // 2
+
+    # Draw body (ellipse)
+    body_width = CELL_SIZE * 0.7
+    body_height = CELL_SIZE * 0.5
+    pygame.draw.ellipse(sprite, color,
+                       (center_x - body_width // 2, center_y - body_height // 2,
+                        body_width, body_height))
+
+    # Draw head (circle)
+    head_radius = CELL_SIZE * 0.25
+    pygame.draw.circle(sprite, color, (int(center_x + body_width // 3), int(center_y)), int(head_radius))
+
+    # Draw ears (triangles)
+    ear_size = CELL_SIZE * 0.15
+    pygame.draw.polygon(sprite, color, [
+        (center_x + body_width // 3 - ear_size, center_y - head_radius),
+        (center_x + body_width // 3 + ear_size, center_y - head_radius),
+        (center_x + body_width // 3, center_y - head_radius - ear_size * 1.5)
+    ])
+    pygame.draw.polygon(sprite, color, [
+        (center_x + body_width // 3 - ear_size * 0.5, center_y - head_radius + 2),
+        (center_x + body_width // 3 + ear_size * 1.5, center_y - head_radius + 2),
+        (center_x + body_width // 3 + ear_size * 0.5, center_y - head_radius - ear_size * 1.5)
+    ])
+
+    return sprite.convert_alpha()
+
+
 class Enemy:
     """Enemy that follows the path toward the toy box."""
 
+    __slots__ = ('type', 'config', 'max_health', 'health', 'speed', 'reward', 'color',
+                 'path', 'path_world', 'path_index', 'x', 'y', 'grid_x', 'grid_y',
+                 'slow_timer', 'original_speed', 'alive', 'reached_end')
+
     def __init__(self, enemy_type, path):
         """Initialize enemy."""
         self.type = enemy_type
@@ -18,9 +59,17 @@ class Enemy:
         self.color = self.config["color"]
 
         self.path = path
+        # Waypoints in pixels; the default path is converted once in config
+        if path is ENEMY_PATH:
+            self.path_world = PATH_WORLD
+        else:
+            self.path_world = tuple(
+                (x * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_X, y * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_Y)
+                for x, y in path
+            )
         self.path_index = 0
-        self.x = path[0][0] * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_X
-        self.y = path[0][1] * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_Y
+        self.x, self.y = self.path_world[0]
+        self._update_grid_position()
 
         self.slow_timer = 0
         self.original_speed = self.speed
@@ -39,17 +88,13 @@ class Enemy:
             self.reached_end = True
             return
 
-        # Get current and target positions
-        current_pos = self.path[self.path_index]
-        target_pos = self.path[self.path_index + 1]
-
-        target_x = target_pos[0] * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_X
-        target_y = target_pos[1] * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_Y
+        # Get target position
+        target_x, target_y = self.path_world[self.path_index + 1]
 
         # Calculate direction
         dx = target_x - self.x
         dy = target_y - self.y
-        dist = (dx ** 2 + dy ** 2) ** 0.5
+        dist = math.hypot(dx, dy)
 
         # Move toward target
         move_dist = self.speed * CELL_SIZE * dt
@@ -58,8 +103,16 @@ class Enemy:
             self.y = target_y
             self.path_index += 1
         else:
-            self.x += (dx / dist) * move_dist
-            self.y += (dy / dist) * move_dist
+            scale = move_dist / dist
+            self.x += dx * scale
+            self.y += dy * scale
+
+        self._update_grid_position()
+
+    def _update_grid_position(self):
+        """Cache the grid cell under the enemy; called whenever it moves."""
+        self.grid_x = int((self.x - GRID_OFFSET_X) // CELL_SIZE)
+        self.grid_y = int((self.y - GRID_OFFSET_Y) // CELL_SIZE)
 
     def apply_slow(self, factor, duration):
         """Apply slow effect to enemy."""
@@ -74,36 +127,16 @@ class Enemy:
 
     def draw(self, surface):
         """Draw enemy as a wind-up mouse shape."""
-        # Calculate grid position for display
-        grid_x = int((self.x - GRID_OFFSET_X) // CELL_SIZE)
-        grid_y = int((self.y - GRID_OFFSET_Y) // CELL_SIZE)
-
         center_x = self.x
         center_y = self.y
 
-        # Draw body (ellipse)
+        # Draw body, head and ears from the cached sprite
         body_width = CELL_SIZE * 0.7
         body_height = CELL_SIZE * 0.5
-        pygame.draw.ellipse(surface, self.color,
-                           (center_x - body_width // 2, center_y - body_height // 2,
-                            body_width, body_height))
-
-        # Draw head (circle)
-        head_radius = CELL_SIZE * 0.25
-        pygame.draw.circle(surface, self.color, (int(center_x + body_width // 3), int(center_y)), int(head_radius))
-
-        # Draw ears (triangles)
-        ear_size = CELL_SIZE * 0.15
-        pygame.draw.polygon(surface, self.color, [
-            (center_x + body_width // 3 - ear_size, center_y - head_radius),
-            (center_x + body_width // 3 + ear_size, center_y - head_radius),
-            (center_x + body_width // 3, center_y - head_radius - ear_size * 1.5)
-        ])
-        pygame.draw.polygon(surface, self.color, [
-            (center_x + body_width // 3 - ear_size * 0.5, center_y - head_radius + 2),
-            (center_x + body_width // 3 + ear_size * 1.5, center_y - head_radius + 2),
-            (center_x + body_width // 3 + ear_size * 0.5, center_y - head_radius - ear_size * 1.5)
-        ])
+        sprite = _SPRITE_CACHE.get(self.type)
+        if sprite is None:
+            sprite = _SPRITE_CACHE[self.type] = _render_sprite(self.color)
+        surface.blit(sprite, (int(center_x) - CELL_SIZE // 2, int(center_y) - CELL_SIZE // 2))
 
         # Draw slow effect
         if self.slow_timer > 0:
@@ -127,9 +160,7 @@ class Enemy:
 
     def get_grid_position(self):
         """Get current grid position."""
-        grid_x = int((self.x - GRID_OFFSET_X) // CELL_SIZE)
-        grid_y = int((self.y - GRID_OFFSET_Y) // CELL_SIZE)
-        return (grid_x, grid_y)
+        return (self.grid_x, self.grid_y)
 
     def is_alive(self):
         """Check if enemy is still alive."""
@@ -177,20 +177,24 @@ class Game:
             self.prepare_wave()
             return
 
-        # Update enemies
-        for enemy in self.enemies[:]:
+        # Update enemies in one pass, keeping those still on the path
+        remaining_enemies = []
+        for enemy in self.enemies:
             enemy.update(dt)
 
             if enemy.reached_end:
                 self.health -= 1
-                self.enemies.remove(enemy)
                 if self.health <= 0:
                     self.game_over = True
 
             elif not enemy.alive:
                 self.score += enemy.reward
                 self.currency += enemy.reward
-                self.enemies.remove(enemy)
+
+            else:
+                remaining_enemies.append(enemy)
+
+        self.enemies = remaining_enemies
 
         # Update towers
         for tower in self.towers: